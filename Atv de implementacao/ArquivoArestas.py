@@ -0,0 +1,212 @@
+import csv
+import os
+import struct
+import sys
+from array import array
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .Rotulos import TabelaRotulos
+
+# Formato binário:
+#   cabeçalho  : MAGICO, versão (uint32), nº de rótulos, nº de arestas e
+#                posição da tabela de rótulos (uint64 cada), little-endian
+#   arestas    : pares (origem, destino) de int32 little-endian
+#   rótulos    : para cada índice, tamanho (uint32) + bytes UTF-8
+MAGICO = b"GRAE"
+VERSAO = 1
+CABECALHO = struct.Struct("<4sIQQQ")
+TAMANHO = struct.Struct("<I")
+
+TAMANHO_BLOCO = 65536
+
+
+def _separador_padrao(caminho: str) -> Optional[str]:
+    extensao = os.path.splitext(caminho)[1].lower()
+    if extensao == ".csv":
+        return ","
+    if extensao == ".tsv":
+        return "\t"
+    return None  # qualquer espaço em branco
+
+
+def ler_arestas(caminho: str, separador: Optional[str] = None) -> Iterator[Tuple[str, str]]:
+    """
+    Lê um arquivo texto de arestas (uma "origem destino" por linha), uma
+    linha por vez, sem carregar o arquivo inteiro na memória.
+
+    Passos:
+    1. Descobrir o separador pela extensão (.csv -> ',', .tsv -> tab,
+       outros -> espaços), se não for informado.
+    2. Para cada linha:
+        - Ignorar linhas vazias e comentários iniciados por '#'.
+        - Gerar o par (origem, destino) com as duas primeiras colunas.
+    Uma linha sem destino gera ValueError com o caminho e o número da linha.
+    """
+    if separador is None:
+        separador = _separador_padrao(caminho)
+
+    with open(caminho, newline="", encoding="utf-8") as arquivo:
+        if separador == ",":
+            linhas = csv.reader(arquivo)
+        else:
+            linhas = (linha.split(separador) for linha in arquivo)
+
+        for numero, campos in enumerate(linhas, 1):
+            if not campos or not campos[0].strip() or campos[0].lstrip().startswith("#"):
+                continue
+            if len(campos) < 2 or not campos[1].strip():
+                # no CSV, um campo entre aspas pode ocupar várias linhas
+                numero = getattr(linhas, "line_num", numero)
+                raise ValueError(f"{caminho}:{numero}: linha sem destino (esperado 'origem destino')")
+            yield campos[0].strip(), campos[1].strip()
+
+
+def em_blocos(arestas: Iterable[Tuple[str, str]], tamanho_bloco: int = TAMANHO_BLOCO) -> Iterator[List[Tuple[str, str]]]:
+    """
+    Agrupa um fluxo de arestas em listas de até 'tamanho_bloco' arestas.
+    """
+    arestas = iter(arestas)
+    while True:
+        bloco = list(islice(arestas, tamanho_bloco))
+        if not bloco:
+            return
+        yield bloco
+
+
+def escrever_arestas(caminho: str, arestas: Iterable[Tuple[str, str]], separador: Optional[str] = None) -> int:
+    """
+    Grava as arestas em texto, uma por linha. Retorna o número de arestas.
+    """
+    if separador is None:
+        separador = _separador_padrao(caminho) or " "
+
+    total = 0
+    with open(caminho, "w", newline="", encoding="utf-8") as arquivo:
+        if separador == ",":
+            escritor = csv.writer(arquivo, lineterminator="\n")
+            for origem, destino in arestas:
+                escritor.writerow((origem, destino))
+                total += 1
+        else:
+            for origem, destino in arestas:
+                arquivo.write(f"{origem}{separador}{destino}\n")
+                total += 1
+    return total
+
+
+def _little_endian(valores: array) -> array:
+    if sys.byteorder != "little":
+        valores.byteswap()
+    return valores
+
+
+def escrever_binario(caminho: str, arestas: Iterable[Tuple[str, str]], tamanho_bloco: int = TAMANHO_BLOCO) -> int:
+    """
+    Grava as arestas no formato binário (pares int32 + tabela de rótulos).
+
+    Passos:
+    1. Reservar o cabeçalho no início do arquivo.
+    2. Para cada aresta, traduzir os rótulos para índices (o primeiro uso
+       de um rótulo define seu índice) e acumular os pares em um bloco.
+    3. Gravar cada bloco cheio, de forma que só a tabela de rótulos fique
+       inteira na memória.
+    4. Gravar a tabela de rótulos no fim e preencher o cabeçalho.
+    Retorna o número de arestas gravadas.
+    """
+    tabela = TabelaRotulos()
+    total = 0
+
+    with open(caminho, "wb") as arquivo:
+        # 1. Reservar o cabeçalho
+        arquivo.write(bytes(CABECALHO.size))
+
+        # 2. e 3. Traduzir e gravar as arestas em blocos
+        bloco = array("i")
+        for origem, destino in arestas:
+            bloco.append(tabela.indice(origem))
+            bloco.append(tabela.indice(destino))
+            total += 1
+            if len(bloco) >= 2 * tamanho_bloco:
+                arquivo.write(_little_endian(bloco).tobytes())
+                bloco = array("i")
+        arquivo.write(_little_endian(bloco).tobytes())
+
+        # 4. Tabela de rótulos e cabeçalho
+        posicao_rotulos = arquivo.tell()
+        for rotulo in tabela:
+            dados = str(rotulo).encode("utf-8")
+            arquivo.write(TAMANHO.pack(len(dados)))
+            arquivo.write(dados)
+
+        arquivo.seek(0)
+        arquivo.write(CABECALHO.pack(MAGICO, VERSAO, len(tabela), total, posicao_rotulos))
+
+    return total
+
+
+def _ler_cabecalho(arquivo) -> Tuple[int, int, int]:
+    dados = arquivo.read(CABECALHO.size)
+    if len(dados) < CABECALHO.size:
+        raise ValueError("arquivo binário de arestas inválido")
+    magico, versao, n_rotulos, n_arestas, posicao_rotulos = CABECALHO.unpack(dados)
+    if magico != MAGICO or versao != VERSAO:
+        raise ValueError("arquivo binário de arestas inválido")
+    return n_rotulos, n_arestas, posicao_rotulos
+
+
+def ler_binario(caminho: str, tamanho_bloco: int = TAMANHO_BLOCO) -> Iterator[Tuple[str, str]]:
+    """
+    Lê um arquivo gravado por 'escrever_binario', gerando as arestas
+    (origem, destino) bloco a bloco.
+
+    Passos:
+    1. Ler o cabeçalho e a tabela de rótulos (no fim do arquivo).
+    2. Voltar ao início das arestas e ler 'tamanho_bloco' pares por vez.
+    3. Traduzir cada par de índices para os rótulos.
+    """
+    with open(caminho, "rb") as arquivo:
+        # 1. Cabeçalho e rótulos
+        n_rotulos, n_arestas, posicao_rotulos = _ler_cabecalho(arquivo)
+        arquivo.seek(posicao_rotulos)
+        rotulos = []
+        for _ in range(n_rotulos):
+            (tamanho,) = TAMANHO.unpack(arquivo.read(TAMANHO.size))
+            rotulos.append(arquivo.read(tamanho).decode("utf-8"))
+
+        # 2. e 3. Arestas em blocos
+        arquivo.seek(CABECALHO.size)
+        restantes = n_arestas
+        while restantes:
+            n = min(restantes, tamanho_bloco)
+            bloco = array("i")
+            bloco.frombytes(arquivo.read(8 * n))
+            _little_endian(bloco)
+            for k in range(0, len(bloco), 2):
+                yield rotulos[bloco[k]], rotulos[bloco[k + 1]]
+            restantes -= n
+
+
+def eh_binario(caminho: str) -> bool:
+    with open(caminho, "rb") as arquivo:
+        return arquivo.read(len(MAGICO)) == MAGICO
+
+
+def carregar(grafo, caminho: str, tamanho_bloco: int = TAMANHO_BLOCO, separador: Optional[str] = None, **opcoes):
+    """
+    Carrega as arestas de um arquivo (texto ou binário) em um grafo já
+    criado (Grafo, GrafoListaAdj ou GrafoListaArestas) e o retorna.
+
+    As arestas passam em blocos de 'tamanho_bloco' para
+    'grafo.inserir_arestas_em_lote', então só um bloco do arquivo fica na
+    memória por vez. 'opcoes' seguem para 'inserir_arestas_em_lote'
+    (ex.: nao_direcionado=True nas classes de lista).
+    """
+    if eh_binario(caminho):
+        arestas = ler_binario(caminho, tamanho_bloco)
+    else:
+        arestas = ler_arestas(caminho, separador)
+
+    for bloco in em_blocos(arestas, tamanho_bloco):
+        grafo.inserir_arestas_em_lote(bloco, **opcoes)
+    return grafo
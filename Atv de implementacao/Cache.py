@@ -0,0 +1,47 @@
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class CacheLRU:
+    """
+    Cache de tamanho limitado que descarta o item usado há mais tempo
+    (least recently used) quando passa de 'capacidade' itens.
+    """
+
+    __slots__ = ("capacidade", "_itens", "acertos", "falhas")
+
+    def __init__(self, capacidade: int = 1024) -> None:
+        if capacidade < 1:
+            raise ValueError("a capacidade do cache deve ser positiva")
+        self.capacidade = capacidade
+        self._itens: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter(self, chave: Hashable, padrao: Any = None) -> Any:
+        """
+        Retorna o valor de 'chave' (marcando-o como usado agora) ou 'padrao'.
+        """
+        try:
+            valor = self._itens[chave]
+        except KeyError:
+            self.falhas += 1
+            return padrao
+        self._itens.move_to_end(chave)
+        self.acertos += 1
+        return valor
+
+    def guardar(self, chave: Hashable, valor: Any) -> None:
+        """
+        Guarda 'valor' em 'chave', descartando o item mais antigo se necessário.
+        """
+        self._itens[chave] = valor
+        self._itens.move_to_end(chave)
+        if len(self._itens) > self.capacidade:
+            self._itens.popitem(last=False)
+
+    def limpar(self) -> None:
+        self._itens.clear()
+
+    def __len__(self) -> int:
+        return len(self._itens)
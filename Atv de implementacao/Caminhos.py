@@ -0,0 +1,68 @@
+import heapq
+from itertools import count
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+# vizinhos_com_pesos(v) -> pares (vizinho, peso) das arestas que saem de v
+VizinhosComPesos = Callable[[Hashable], Iterable[Tuple[Hashable, float]]]
+
+
+def dijkstra(vizinhos_com_pesos: VizinhosComPesos, inicio, destino) -> Optional[Tuple[List, float]]:
+    """
+    Menor caminho ponderado (pesos não negativos) de 'inicio' até 'destino'.
+    Retorna (caminho, custo) ou None se 'destino' não for alcançável.
+    """
+    return a_estrela(vizinhos_com_pesos, inicio, destino, lambda v: 0)
+
+
+def a_estrela(vizinhos_com_pesos: VizinhosComPesos, inicio, destino, heuristica: Callable[[Hashable], float]) -> Optional[Tuple[List, float]]:
+    """
+    Busca A* com heap binário; com heurística zero é o algoritmo de Dijkstra.
+
+    Passos:
+    1. Colocar 'inicio' no heap com prioridade heuristica(inicio) e custo 0.
+    2. Enquanto o heap não estiver vazio:
+        a. Retirar o vértice de menor prioridade (custo + heurística).
+        b. Ignorar a entrada se ela for de um custo já superado.
+        c. Se for 'destino', parar e reconstruir o caminho pelos pais.
+        d. Para cada (vizinho, peso), se custo + peso melhorar o custo do
+           vizinho, atualizar o pai e colocar no heap.
+    3. Retornar None se o heap esvaziar sem chegar em 'destino'.
+
+    A heurística deve ser admissível (nunca maior que o custo real até
+    'destino') para o caminho retornado ser o menor.
+
+    Cada vértice retirado do heap chama 'vizinhos_com_pesos' uma vez: com
+    listas (custo proporcional ao grau) a busca roda em O((V+E) log V); nas
+    matrizes, que varrem a linha inteira, em O(V² + E log V).
+    """
+    custos: Dict[Hashable, float] = {inicio: 0}
+    pais: Dict[Hashable, Optional[Hashable]] = {inicio: None}
+    desempate = count()  # evita comparar rótulos no heap
+    heap = [(heuristica(inicio), next(desempate), 0, inicio)]
+
+    while heap:
+        # a. Menor prioridade
+        _, _, custo, atual = heapq.heappop(heap)
+
+        # b. Entrada desatualizada
+        if custo > custos[atual]:
+            continue
+
+        # c. Chegou ao destino
+        if atual == destino:
+            caminho = []
+            while atual is not None:
+                caminho.append(atual)
+                atual = pais[atual]
+            caminho.reverse()
+            return caminho, custo
+
+        # d. Relaxar as arestas
+        for vizinho, peso in vizinhos_com_pesos(atual):
+            novo = custo + peso
+            if vizinho not in custos or novo < custos[vizinho]:
+                custos[vizinho] = novo
+                pais[vizinho] = atual
+                heapq.heappush(heap, (novo + heuristica(vizinho), next(desempate), novo, vizinho))
+
+    return None
@@ -0,0 +1,181 @@
+from typing import Callable, Dict, Hashable, Iterable, List
+
+# vizinhos(v) -> vértices para onde saem as arestas de v
+Vizinhos = Callable[[Hashable], Iterable[Hashable]]
+
+
+class UniaoBusca:
+    """
+    Estrutura de união e busca (union-find) com compressão de caminho e
+    união por tamanho: 'unir' e 'encontrar' custam O(α(n)), quase constante.
+
+    Guarda os componentes conexos (ignorando a direção das arestas) de um
+    conjunto de elementos que só cresce; não há como desfazer uma união.
+    """
+
+    __slots__ = ("_pais", "_tamanhos", "componentes")
+
+    def __init__(self, elementos: Iterable[Hashable] = ()) -> None:
+        self._pais: Dict[Hashable, Hashable] = {}
+        self._tamanhos: Dict[Hashable, int] = {}
+        self.componentes = 0
+        for x in elementos:
+            self.adicionar(x)
+
+    def adicionar(self, x: Hashable) -> None:
+        """
+        Registra 'x' como um componente próprio (se ainda não estiver registrado).
+        """
+        if x not in self._pais:
+            self._pais[x] = x
+            self._tamanhos[x] = 1
+            self.componentes += 1
+
+    def encontrar(self, x: Hashable) -> Hashable:
+        """
+        Retorna o representante do componente de 'x'.
+
+        Passos:
+        1. Subir pelos pais até a raiz.
+        2. Subir de novo, apontando cada elemento do caminho direto para a raiz.
+        """
+        pais = self._pais
+        # 1. Achar a raiz
+        raiz = x
+        while pais[raiz] != raiz:
+            raiz = pais[raiz]
+
+        # 2. Comprimir o caminho
+        while pais[x] != raiz:
+            pais[x], x = raiz, pais[x]
+        return raiz
+
+    def unir(self, a: Hashable, b: Hashable) -> bool:
+        """
+        Junta os componentes de 'a' e 'b' (registrando-os se forem novos),
+        pendurando a árvore menor na maior. Retorna False se já estavam juntos.
+        """
+        self.adicionar(a)
+        self.adicionar(b)
+        a = self.encontrar(a)
+        b = self.encontrar(b)
+        if a == b:
+            return False
+        if self._tamanhos[a] < self._tamanhos[b]:
+            a, b = b, a
+        self._pais[b] = a
+        self._tamanhos[a] += self._tamanhos.pop(b)
+        self.componentes -= 1
+        return True
+
+    def conectados(self, a: Hashable, b: Hashable) -> bool:
+        """
+        True se 'a' e 'b' estão registrados e no mesmo componente.
+        """
+        if a not in self._pais or b not in self._pais:
+            return False
+        return self.encontrar(a) == self.encontrar(b)
+
+    def grupos(self) -> List[List[Hashable]]:
+        """
+        Lista os componentes, cada um com seus elementos na ordem de registro.
+        """
+        grupos: Dict[Hashable, List[Hashable]] = {}
+        for x in self._pais:
+            grupos.setdefault(self.encontrar(x), []).append(x)
+        return list(grupos.values())
+
+    def __copy__(self) -> "UniaoBusca":
+        # cópia independente: as uniões feitas em uma não aparecem na outra
+        nova = UniaoBusca()
+        nova._pais = dict(self._pais)
+        nova._tamanhos = dict(self._tamanhos)
+        nova.componentes = self.componentes
+        return nova
+
+    def __contains__(self, x: Hashable) -> bool:
+        return x in self._pais
+
+    def __len__(self) -> int:
+        return len(self._pais)
+
+
+def uniao_das_arestas(vertices: Iterable[Hashable], vizinhos: Vizinhos) -> UniaoBusca:
+    """
+    Monta a união e busca de um grafo: cada vértice começa sozinho e cada
+    aresta v -> w une os dois lados. Roda em O((V + E) α(V)).
+    """
+    uniao = UniaoBusca()
+    for v in vertices:
+        uniao.adicionar(v)
+        for w in vizinhos(v):
+            uniao.unir(v, w)
+    return uniao
+
+
+def componentes_fortemente_conexas(vertices: Iterable[Hashable], vizinhos: Vizinhos) -> List[List[Hashable]]:
+    """
+    Componentes fortemente conexas (algoritmo de Tarjan, sem recursão).
+
+    Passos:
+    1. Para cada vértice ainda não visitado, iniciar uma busca em
+       profundidade com uma pilha explícita de (vértice, iterador de vizinhos).
+    2. Ao descer para um vértice, dar a ele o próximo número de visita
+       ('ordem' e 'menor' iguais) e empilhá-lo também em 'pilha'.
+    3. Ao ver um vizinho que ainda está em 'pilha', baixar 'menor' do vértice atual.
+    4. Ao terminar os vizinhos de um vértice:
+        - Se 'menor' == 'ordem', ele é a raiz de um componente: desempilhar
+          'pilha' até ele e registrar o componente.
+        - Repassar 'menor' para o pai na busca.
+    Roda em O(V + E). Os componentes saem em ordem topológica reversa.
+    """
+    ordem: Dict[Hashable, int] = {}
+    menor: Dict[Hashable, int] = {}
+    na_pilha = set()
+    pilha: List[Hashable] = []
+    componentes: List[List[Hashable]] = []
+
+    for raiz in vertices:
+        if raiz in ordem:
+            continue
+
+        # 1. e 2. Busca em profundidade a partir de 'raiz'
+        ordem[raiz] = menor[raiz] = len(ordem)
+        pilha.append(raiz)
+        na_pilha.add(raiz)
+        busca = [(raiz, iter(vizinhos(raiz)))]
+
+        while busca:
+            v, restantes = busca[-1]
+            desceu = False
+            for w in restantes:
+                if w not in ordem:
+                    ordem[w] = menor[w] = len(ordem)
+                    pilha.append(w)
+                    na_pilha.add(w)
+                    busca.append((w, iter(vizinhos(w))))
+                    desceu = True
+                    break
+                # 3. Vizinho ainda na pilha: aresta de volta
+                if w in na_pilha and ordem[w] < menor[v]:
+                    menor[v] = ordem[w]
+            if desceu:
+                continue
+
+            # 4. Vizinhos de 'v' esgotados
+            busca.pop()
+            if menor[v] == ordem[v]:
+                componente = []
+                while True:
+                    w = pilha.pop()
+                    na_pilha.discard(w)
+                    componente.append(w)
+                    if w == v:
+                        break
+                componentes.append(componente)
+            if busca:
+                pai = busca[-1][0]
+                if menor[v] < menor[pai]:
+                    menor[pai] = menor[v]
+
+    return componentes
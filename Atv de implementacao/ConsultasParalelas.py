@@ -0,0 +1,93 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .FormatoCSR import GrafoCSR
+
+# grafo somente leitura de cada processo trabalhador (definido em '_iniciar')
+_GRAFO: Optional[GrafoCSR] = None
+
+
+def _iniciar(grafo) -> None:
+    global _GRAFO
+    # caminho de arquivo: cada processo mapeia o mesmo arquivo (páginas compartilhadas)
+    _GRAFO = GrafoCSR.abrir(grafo) if isinstance(grafo, str) else grafo
+
+
+def _caminhos_da_origem(grafo: GrafoCSR, origem: str, destinos: List[str]):
+    """
+    Uma única BFS a partir de 'origem' responde todos os destinos dela.
+    """
+    resultado = []
+    s = grafo.indices.get(origem)
+    if s is None:
+        return [((origem, destino), None) for destino in destinos]
+
+    _, pais = grafo._percorrer(s)
+    for destino in destinos:
+        t = grafo.indices.get(destino)
+        if t is None or pais[t] is None:
+            resultado.append(((origem, destino), None))
+            continue
+        caminho = [t]
+        while pais[t] != t:
+            t = pais[t]
+            caminho.append(t)
+        resultado.append(((origem, destino), [grafo.vertices[i] for i in reversed(caminho)]))
+    return resultado
+
+
+def _trabalhar(grupo: Tuple[str, List[str]]):
+    return _caminhos_da_origem(_GRAFO, *grupo)
+
+
+def menores_caminhos_em_lote(grafo, pares: Iterable[Tuple[str, str]], processos: Optional[int] = None) -> Dict[Tuple[str, str], Optional[List[str]]]:
+    """
+    Calcula 'menorCaminho' para muitos pares (inicio, destino) usando um
+    pool de processos.
+
+    Passos:
+    1. Agrupar os pares por origem, para que cada árvore de BFS sirva a
+       todos os destinos daquela origem.
+    2. Obter uma cópia somente leitura do grafo:
+        - caminho de arquivo gravado por 'GrafoCSR.salvar': cada processo
+          abre o arquivo com mmap (sem cópia);
+        - GrafoCSR: enviado uma vez para cada processo;
+        - Grafo, GrafoListaAdj ou GrafoListaArestas: congelado antes.
+    3. Distribuir os grupos entre os processos (ou rodar no próprio
+       processo se processos=1).
+    4. Retornar {(inicio, destino): caminho ou None}.
+    """
+    # 1. Agrupar por origem
+    grupos: Dict[str, List[str]] = {}
+    for inicio, destino in pares:
+        grupos.setdefault(inicio, []).append(destino)
+
+    # 2. Cópia somente leitura
+    if not isinstance(grafo, (str, GrafoCSR)):
+        grafo = grafo.congelar()
+
+    if processos is None:
+        processos = os.cpu_count() or 1
+    processos = max(1, min(processos, len(grupos)))
+
+    resultado: Dict[Tuple[str, str], Optional[List[str]]] = {}
+
+    # 3. Rodar no próprio processo ou no pool
+    if processos == 1:
+        local = GrafoCSR.abrir(grafo) if isinstance(grafo, str) else grafo
+        try:
+            for origem, destinos in grupos.items():
+                resultado.update(_caminhos_da_origem(local, origem, destinos))
+        finally:
+            if local is not grafo:
+                local.fechar()
+        return resultado
+
+    tamanho_lote = max(1, len(grupos) // (processos * 4))
+    with ProcessPoolExecutor(processos, initializer=_iniciar, initargs=(grafo,)) as pool:
+        for respostas in pool.map(_trabalhar, grupos.items(), chunksize=tamanho_lote):
+            resultado.update(respostas)
+
+    # 4. Resultado por par
+    return resultado
@@ -0,0 +1,457 @@
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+from .Rotulos import TabelaRotulos
+
+# Formato em disco (little-endian), pensado para ser aberto com mmap:
+#   cabeçalho : MAGICO, versão (uint32), nº de vértices, nº de arestas,
+#               direcionado (0/1) e posição da tabela de rótulos (uint64 cada)
+#   offsets   : V+1 valores int64
+#   destinos  : E valores int32
+#   rótulos   : para cada índice, tamanho (uint32) + bytes UTF-8
+MAGICO = b"GCSR"
+VERSAO = 1
+CABECALHO = struct.Struct("<4sIQQQQ")
+TAMANHO = struct.Struct("<I")
+
+
+class GrafoCSR:
+    """
+    Grafo imutável no formato CSR (compressed sparse row).
+
+    Os vértices viram índices 0..V-1 (tabela de rótulos em 'vertices') e as
+    arestas ficam em dois arrays contíguos:
+        - offsets[i] .. offsets[i+1]: fatia de 'destinos' com as saídas de i
+        - destinos: índices de destino, ordenados dentro de cada linha
+    Isso dá cerca de 4 bytes por aresta e 8 por vértice, contra centenas de
+    bytes por aresta nas estruturas de listas e dicionários.
+
+    É criado por 'congelar()' em Grafo, GrafoListaAdj e GrafoListaArestas e
+    responde às consultas de leitura com os mesmos nomes de método. Também
+    pode ser gravado com 'salvar' e reaberto com 'abrir', que mapeia o
+    arquivo na memória sem copiar os arrays.
+    """
+
+    __slots__ = ("vertices", "indices", "_rotulos", "offsets", "destinos",
+                 "direcionado", "_mapa", "_transposta")
+
+    def __init__(self, vertices: Iterable[str], offsets, destinos, direcionado: bool = True) -> None:
+        self._rotulos = TabelaRotulos(vertices)
+        self.vertices: List[str] = self._rotulos.rotulos
+        self.indices: Dict[str, int] = self._rotulos.indices
+        self.offsets = offsets
+        self.destinos = destinos
+        self.direcionado = direcionado
+        self._mapa = None
+        self._transposta = None
+
+    @classmethod
+    def de_listas(cls, vertices: Iterable[str], linhas: Iterable[Iterable[int]], direcionado: bool = True) -> "GrafoCSR":
+        """
+        Monta o CSR a partir das listas de saída (em índices) de cada vértice.
+
+        Passos:
+        1. Para cada vértice i, ordenar os índices de destino da linha i.
+        2. Copiar a linha para o fim de 'destinos'.
+        3. Registrar em 'offsets' onde a linha seguinte começa.
+        """
+        offsets = array('q', [0])
+        destinos = array('i')
+        for linha in linhas:
+            destinos.extend(sorted(linha))
+            offsets.append(len(destinos))
+        return cls(vertices, offsets, destinos, direcionado)
+
+    def salvar(self, caminho: str) -> None:
+        """
+        Grava o grafo no formato em disco (veja o início do módulo).
+
+        Passos:
+        1. Gravar o cabeçalho.
+        2. Gravar 'offsets' e 'destinos' como estão na memória.
+        3. Gravar a tabela de rótulos.
+        """
+        offsets = array('q', self.offsets)
+        destinos = array('i', self.destinos)
+        if sys.byteorder != "little":
+            offsets.byteswap()
+            destinos.byteswap()
+
+        posicao_rotulos = CABECALHO.size + 8 * len(offsets) + 4 * len(destinos)
+        with open(caminho, "wb") as arquivo:
+            # 1. Cabeçalho
+            arquivo.write(CABECALHO.pack(MAGICO, VERSAO, len(self.vertices), len(destinos),
+                                         int(self.direcionado), posicao_rotulos))
+            # 2. Arrays
+            arquivo.write(offsets.tobytes())
+            arquivo.write(destinos.tobytes())
+            # 3. Rótulos
+            for rotulo in self.vertices:
+                dados = str(rotulo).encode("utf-8")
+                arquivo.write(TAMANHO.pack(len(dados)))
+                arquivo.write(dados)
+
+    @classmethod
+    def abrir(cls, caminho: str) -> "GrafoCSR":
+        """
+        Abre um arquivo gravado por 'salvar' usando mmap.
+
+        'offsets' e 'destinos' viram memoryviews sobre o próprio arquivo
+        mapeado (sem cópia), então vários processos que abrem o mesmo
+        arquivo compartilham as mesmas páginas do cache do sistema. Só a
+        tabela de rótulos é lida para objetos Python. Use 'fechar' (ou
+        'with') para liberar o mapeamento.
+        """
+        with open(caminho, "rb") as arquivo:
+            mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magico, versao, n, e, direcionado, posicao_rotulos = CABECALHO.unpack_from(mapa, 0)
+        if magico != MAGICO or versao != VERSAO:
+            mapa.close()
+            raise ValueError("arquivo CSR inválido")
+
+        inicio_destinos = CABECALHO.size + 8 * (n + 1)
+        if sys.byteorder == "little":
+            memoria = memoryview(mapa)
+            offsets = memoria[CABECALHO.size:inicio_destinos].cast('q')
+            destinos = memoria[inicio_destinos:inicio_destinos + 4 * e].cast('i')
+        else:
+            # arquivo little-endian em máquina big-endian: precisa copiar
+            offsets = array('q', mapa[CABECALHO.size:inicio_destinos])
+            destinos = array('i', mapa[inicio_destinos:inicio_destinos + 4 * e])
+            offsets.byteswap()
+            destinos.byteswap()
+
+        vertices = []
+        posicao = posicao_rotulos
+        for _ in range(n):
+            (tamanho,) = TAMANHO.unpack_from(mapa, posicao)
+            posicao += TAMANHO.size
+            vertices.append(mapa[posicao:posicao + tamanho].decode("utf-8"))
+            posicao += tamanho
+
+        g = cls(vertices, offsets, destinos, bool(direcionado))
+        g._mapa = mapa
+        return g
+
+    def fechar(self) -> None:
+        """
+        Libera o mapeamento de memória de um grafo aberto com 'abrir'.
+        """
+        if self._mapa is None:
+            return
+        if isinstance(self.offsets, memoryview):
+            self.offsets.release()
+            self.destinos.release()
+        self._mapa.close()
+        self._mapa = None
+
+    def __getstate__(self):
+        # Para enviar a outro processo: só rótulos e arrays (o mapa de
+        # índices é refeito do outro lado e o mmap vira cópia em array).
+        return {
+            "vertices": self.vertices,
+            "offsets": array('q', self.offsets),
+            "destinos": array('i', self.destinos),
+            "direcionado": self.direcionado,
+        }
+
+    def __setstate__(self, estado):
+        self.__init__(estado["vertices"], estado["offsets"], estado["destinos"], estado["direcionado"])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def _linha(self, i: int):
+        return self.destinos[self.offsets[i]:self.offsets[i + 1]]
+
+    def vizinhos(self, vertice) -> List[str]:
+        """
+        Retorna os vizinhos (saídas) de 'vertice', na ordem dos índices.
+        """
+        if vertice not in self.indices:
+            return []
+        return [self.vertices[j] for j in self._linha(self.indices[vertice])]
+
+    def existe_aresta(self, origem, destino) -> bool:
+        """
+        Verifica a aresta origem -> destino com busca binária na linha de 'origem'.
+        """
+        if origem not in self.indices or destino not in self.indices:
+            return False
+        i = self.indices[origem]
+        j = self.indices[destino]
+        inicio, fim = self.offsets[i], self.offsets[i + 1]
+        k = bisect_left(self.destinos, j, inicio, fim)
+        return k < fim and self.destinos[k] == j
+
+    def grau_vertices(self):
+        """
+        Calcula o grau de cada vértice.
+
+        Passos:
+        1. Grau de saída: offsets[i+1] - offsets[i].
+        2. Se o grafo for direcionado:
+            - Grau de entrada: contar as ocorrências de i em 'destinos'.
+            - graus[v] = {"saida": x, "entrada": y, "total": x + y}.
+        3. Se não, graus[v] = grau de saída.
+        """
+        n = len(self.vertices)
+        saidas = [self.offsets[i + 1] - self.offsets[i] for i in range(n)]
+        if not self.direcionado:
+            return dict(zip(self.vertices, saidas))
+
+        entradas = [0] * n
+        for j in self.destinos:
+            entradas[j] += 1
+
+        graus = {}
+        for v, saida, entrada in zip(self.vertices, saidas, entradas):
+            graus[v] = {"saida": saida, "entrada": entrada, "total": saida + entrada}
+        return graus
+
+    def percurso_valido(self, caminho) -> bool:
+        """
+        Verifica se existe aresta entre cada par consecutivo de 'caminho'.
+        """
+        for i in range(len(caminho) - 1):
+            if not self.existe_aresta(caminho[i], caminho[i + 1]):
+                return False
+        return True
+
+    def _existem(self, origens: List[int], destinos: List[int]) -> List[bool]:
+        # busca binária de cada destino na linha (ordenada) da origem
+        offsets, linhas = self.offsets, self.destinos
+        existe = []
+        for i, j in zip(origens, destinos):
+            if i < 0 or j < 0:
+                existe.append(False)
+                continue
+            fim = offsets[i + 1]
+            k = bisect_left(linhas, j, offsets[i], fim)
+            existe.append(k < fim and linhas[k] == j)
+        return existe
+
+    def existe_arestas(self, pares) -> List[bool]:
+        """
+        Versão em lote de 'existe_aresta': traduz os rótulos para índices e
+        faz uma busca binária por par. Uma resposta por par (origem, destino).
+        """
+        indices = self.indices
+        origens, destinos = [], []
+        for origem, destino in pares:
+            origens.append(indices.get(origem, -1))
+            destinos.append(indices.get(destino, -1))
+        return self._existem(origens, destinos)
+
+    def percursos_validos(self, caminhos) -> List[bool]:
+        """
+        Versão em lote de 'percurso_valido': traduz cada vértice uma única
+        vez, verifica os passos de todos os caminhos juntos e responde um
+        booleano por caminho.
+        """
+        indices = self.indices
+        origens: List[int] = []
+        destinos: List[int] = []
+        limites = [0]
+        for caminho in caminhos:
+            ids = [indices.get(v, -1) for v in caminho]
+            origens.extend(ids[:-1])
+            destinos.extend(ids[1:])
+            limites.append(len(origens))
+        existe = self._existem(origens, destinos)
+        return [all(existe[a:b]) for a, b in zip(limites, limites[1:])]
+
+    def _percorrer(self, s: int, alvo: Optional[int] = None):
+        # BFS com deque e vetor de pais; mesmo contrato de 'Grafo._percorrer'
+        pais: List[Optional[int]] = [None] * len(self.vertices)
+        pais[s] = s
+        ordem = [s]
+        fila = deque(ordem)
+        offsets, destinos = self.offsets, self.destinos
+
+        while fila:
+            atual = fila.popleft()
+            if atual == alvo:
+                break
+            for k in range(offsets[atual], offsets[atual + 1]):
+                j = destinos[k]
+                if pais[j] is None:
+                    pais[j] = atual
+                    fila.append(j)
+                    ordem.append(j)
+
+        return ordem, pais
+
+    def bfs(self, inicio: str = None) -> List[str]:
+        """
+        Busca em largura a partir de 'inicio' (ou do primeiro vértice, se
+        'inicio' não existir). Os vizinhos são visitados na ordem dos índices.
+        """
+        if not self.vertices: return []
+
+        start_node = inicio if inicio in self.indices else self.vertices[0]
+        ordem, _ = self._percorrer(self.indices[start_node])
+        return [self.vertices[i] for i in ordem]
+
+    def bfs_multiplas_origens(self, origens, profundidade_maxima: Optional[int] = None, com_pais: bool = False):
+        """
+        BFS nível por nível a partir de várias origens; mesmo contrato de
+        'Grafo.bfs_multiplas_origens' ({vertice: distancia} e, com
+        com_pais=True, também {vertice: pai}).
+        """
+        visitados = bytearray(len(self.vertices))
+        distancias: Dict[str, int] = {}
+        pais: Dict[str, Optional[str]] = {}
+
+        fronteira = []
+        for origem in origens:
+            i = self.indices.get(origem)
+            if i is None or visitados[i]:
+                continue
+            visitados[i] = 1
+            fronteira.append(i)
+            distancias[origem] = 0
+            pais[origem] = None
+
+        offsets, destinos = self.offsets, self.destinos
+        distancia = 0
+        while fronteira and (profundidade_maxima is None or distancia < profundidade_maxima):
+            distancia += 1
+            proxima = []
+            for u in fronteira:
+                for k in range(offsets[u], offsets[u + 1]):
+                    j = destinos[k]
+                    if not visitados[j]:
+                        visitados[j] = 1
+                        v = self.vertices[j]
+                        distancias[v] = distancia
+                        pais[v] = self.vertices[u]
+                        proxima.append(j)
+            fronteira = proxima
+
+        if com_pais:
+            return distancias, pais
+        return distancias
+
+    # parâmetros da troca de direção na 'bfs_direcional' (Beamer et al.)
+    ALFA = 14
+    BETA = 24
+
+    def _entradas(self):
+        """
+        CSR das entradas (grafo transposto), montado na primeira chamada.
+        Em grafo não direcionado é o próprio CSR.
+        """
+        if not self.direcionado:
+            return self.offsets, self.destinos
+        if self._transposta is None:
+            n = len(self.vertices)
+            # contagem das entradas de cada vértice -> offsets
+            offsets = array('q', bytes(8 * (n + 1)))
+            for j in self.destinos:
+                offsets[j + 1] += 1
+            for i in range(n):
+                offsets[i + 1] += offsets[i]
+            # distribui as origens (já saem em ordem crescente)
+            origens = array('i', bytes(4 * len(self.destinos)))
+            proxima = array('q', offsets[:n])
+            for i in range(n):
+                for k in range(self.offsets[i], self.offsets[i + 1]):
+                    j = self.destinos[k]
+                    origens[proxima[j]] = i
+                    proxima[j] += 1
+            self._transposta = (offsets, origens)
+        return self._transposta
+
+    def bfs_direcional(self, inicio: str, com_pais: bool = False):
+        """
+        BFS com troca de direção (de cima para baixo / de baixo para cima),
+        mesmo contrato de 'Grafo.bfs_direcional'. O passo de baixo para cima
+        usa o CSR transposto ('_entradas').
+        """
+        n = len(self.vertices)
+        distancias: Dict[str, int] = {}
+        pais: Dict[str, Optional[str]] = {}
+        s = self.indices.get(inicio)
+        if s is None:
+            return (distancias, pais) if com_pais else distancias
+
+        offsets, destinos = self.offsets, self.destinos
+        entrada_offsets, entrada_origens = self._entradas()
+
+        visitados = bytearray(n)
+        visitados[s] = 1
+        distancias[inicio] = 0
+        pais[inicio] = None
+        fronteira = [s]
+        restantes = len(destinos) - (offsets[s + 1] - offsets[s])
+        baixo_para_cima = False
+        distancia = 0
+
+        while fronteira:
+            m_f = sum(offsets[u + 1] - offsets[u] for u in fronteira)
+            if not baixo_para_cima and m_f > restantes / self.ALFA:
+                baixo_para_cima = True
+            elif baixo_para_cima and len(fronteira) < n / self.BETA:
+                baixo_para_cima = False
+
+            distancia += 1
+            novos = []
+            if baixo_para_cima:
+                na_fronteira = bytearray(n)
+                for u in fronteira:
+                    na_fronteira[u] = 1
+                for j in range(n):
+                    if visitados[j]:
+                        continue
+                    for k in range(entrada_offsets[j], entrada_offsets[j + 1]):
+                        u = entrada_origens[k]
+                        if na_fronteira[u]:
+                            novos.append((j, u))
+                            break
+                for j, _ in novos:
+                    visitados[j] = 1
+            else:
+                for u in fronteira:
+                    for k in range(offsets[u], offsets[u + 1]):
+                        j = destinos[k]
+                        if not visitados[j]:
+                            visitados[j] = 1
+                            novos.append((j, u))
+
+            fronteira = []
+            for j, u in novos:
+                v = self.vertices[j]
+                distancias[v] = distancia
+                pais[v] = self.vertices[u]
+                restantes -= offsets[j + 1] - offsets[j]
+                fronteira.append(j)
+
+        return (distancias, pais) if com_pais else distancias
+
+    def menorCaminho(self, inicio: str, destino: str) -> Optional[List[str]]:
+        """
+        Menor caminho (em número de arestas) de 'inicio' até 'destino', ou None.
+        """
+        if inicio not in self.indices or destino not in self.indices:
+            return None
+
+        t = self.indices[destino]
+        _, pais = self._percorrer(self.indices[inicio], alvo=t)
+        if pais[t] is None:
+            return None
+
+        caminho = [t]
+        while pais[t] != t:
+            t = pais[t]
+            caminho.append(t)
+        return [self.vertices[i] for i in reversed(caminho)]
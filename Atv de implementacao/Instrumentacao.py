@@ -0,0 +1,266 @@
+import functools
+import math
+from collections import deque
+from time import perf_counter
+from types import FunctionType
+from typing import Callable, Dict, List, Optional
+
+# gancho(metodo, segundos, vertices_tocados, arestas_tocadas), chamado ao fim de cada chamada
+Gancho = Callable[[str, float, int, int], None]
+
+# Métodos internos que expandem um vértice (devolvem seus vizinhos): cada
+# chamada conta 1 vértice e len(vizinhos) arestas tocados. A classe é
+# procurada pelo nome ao longo da herança (GrafoNumpy usa a regra de Grafo).
+_EXPANSOES = {
+    "Grafo": ("_saidas", "_predecessores"),
+    "GrafoListaAdj": ("_vizinhos_com_pesos",),
+    "GrafoListaArestas": ("_vizinhos_com_pesos",),
+}
+
+# Percursos que não passam pelas expansões acima (GrafoBits expande linhas
+# inteiras com operações bit a bit): conta-se pelo resultado (ordem, pais),
+# com as arestas de saída de cada vértice visitado.
+_PERCURSOS = {
+    "GrafoBits": ("_percorrer",),
+}
+
+# Expansões de um nível inteiro da BFS (bfs_multiplas_origens,
+# bfs_direcional) que não passam por '_saidas': conta-se pela fronteira
+# recebida, com as arestas de saída de cada vértice dela, como se cada um
+# tivesse sido expandido. Em Grafo só o passo de baixo para cima; o de cima
+# para baixo já conta por '_saidas'.
+_NIVEIS = {
+    "Grafo": ("_expandir_nivel_por_entradas",),
+    "GrafoNumpy": ("_expandir_nivel", "_expandir_nivel_por_entradas"),
+    "GrafoBits": ("_expandir_nivel", "_expandir_nivel_por_entradas"),
+}
+
+PERCENTIS = (50, 90, 99)
+
+
+class Metricas:
+    """
+    Contadores de um grafo instrumentado (veja 'instrumentar'), por método
+    público: chamadas, tempo total, percentis de latência sobre as últimas
+    'amostras' chamadas e vértices/arestas tocados pelos percursos.
+
+    Uma chamada que chama outro método público conta nos dois (tempo e
+    tocados inclusivos, como em um profiler). Não é segura entre threads.
+    """
+
+    __slots__ = ("amostras", "gancho", "_chamadas", "_tempo", "_latencias", "_vertices", "_arestas", "_pilha")
+
+    def __init__(self, gancho: Optional[Gancho] = None, amostras: int = 1024) -> None:
+        self.amostras = amostras
+        self.gancho = gancho
+        self._chamadas: Dict[str, int] = {}
+        self._tempo: Dict[str, float] = {}
+        self._latencias: Dict[str, deque] = {}
+        self._vertices: Dict[str, int] = {}
+        self._arestas: Dict[str, int] = {}
+        # [vertices, arestas] de cada chamada pública em andamento
+        self._pilha: List[List[int]] = []
+
+    def registrar(self, metodo: str, segundos: float, vertices: int = 0, arestas: int = 0) -> None:
+        """
+        Soma uma chamada de 'metodo' aos contadores e repassa ao gancho.
+        """
+        if metodo not in self._chamadas:
+            self._chamadas[metodo] = 0
+            self._tempo[metodo] = 0.0
+            self._latencias[metodo] = deque(maxlen=self.amostras)
+            self._vertices[metodo] = 0
+            self._arestas[metodo] = 0
+        self._chamadas[metodo] += 1
+        self._tempo[metodo] += segundos
+        self._latencias[metodo].append(segundos)
+        self._vertices[metodo] += vertices
+        self._arestas[metodo] += arestas
+        if self.gancho is not None:
+            self.gancho(metodo, segundos, vertices, arestas)
+
+    def zerar(self) -> None:
+        """
+        Apaga os contadores (o gancho continua).
+        """
+        for contadores in (self._chamadas, self._tempo, self._latencias, self._vertices, self._arestas):
+            contadores.clear()
+
+    def retrato(self) -> Dict[str, Dict[str, float]]:
+        """
+        Retorna um dicionário simples (pronto para JSON) com os contadores:
+        {metodo: {"chamadas", "tempo_total", "tempo_medio", "p50", "p90",
+        "p99", "vertices_tocados", "arestas_tocadas"}}, tempos em segundos.
+        """
+        retrato = {}
+        for metodo, chamadas in self._chamadas.items():
+            latencias = sorted(self._latencias[metodo])
+            dados = {
+                "chamadas": chamadas,
+                "tempo_total": self._tempo[metodo],
+                "tempo_medio": self._tempo[metodo] / chamadas,
+            }
+            for p in PERCENTIS:
+                # percentil pelo posto mais próximo
+                dados[f"p{p}"] = latencias[max(0, math.ceil(p / 100 * len(latencias)) - 1)]
+            dados["vertices_tocados"] = self._vertices[metodo]
+            dados["arestas_tocadas"] = self._arestas[metodo]
+            retrato[metodo] = dados
+        return retrato
+
+
+def _medir(nome: str, funcao: FunctionType) -> FunctionType:
+    @functools.wraps(funcao)
+    def medido(self, *args, **kwargs):
+        metricas = type(self)._metricas
+        metricas._pilha.append([0, 0])
+        inicio = perf_counter()
+        try:
+            return funcao(self, *args, **kwargs)
+        finally:
+            segundos = perf_counter() - inicio
+            vertices, arestas = metricas._pilha.pop()
+            if metricas._pilha:
+                externa = metricas._pilha[-1]
+                externa[0] += vertices
+                externa[1] += arestas
+            metricas.registrar(nome, segundos, vertices, arestas)
+    return medido
+
+
+def _contar_expansao(funcao: FunctionType) -> FunctionType:
+    @functools.wraps(funcao)
+    def contado(self, *args):
+        vizinhos = funcao(self, *args)
+        if not hasattr(vizinhos, "__len__"):
+            vizinhos = list(vizinhos)
+        pilha = type(self)._metricas._pilha
+        if pilha:
+            pilha[-1][0] += 1
+            pilha[-1][1] += len(vizinhos)
+        return vizinhos
+    return contado
+
+
+def _contar_percurso(funcao: FunctionType) -> FunctionType:
+    @functools.wraps(funcao)
+    def contado(self, *args, **kwargs):
+        ordem, pais = funcao(self, *args, **kwargs)
+        pilha = type(self)._metricas._pilha
+        if pilha:
+            pilha[-1][0] += len(ordem)
+            pilha[-1][1] += sum(self._grau_saida[i] for i in ordem)
+        return ordem, pais
+    return contado
+
+
+def _contar_nivel(funcao: FunctionType) -> FunctionType:
+    @functools.wraps(funcao)
+    def contado(self, fronteira, visitados):
+        pilha = type(self)._metricas._pilha
+        if pilha:
+            pilha[-1][0] += len(fronteira)
+            pilha[-1][1] += sum(self._grau_saida[u] for u in fronteira)
+        return funcao(self, fronteira, visitados)
+    return contado
+
+
+def _reduce_ex(self, protocolo):
+    # pickle e deepcopy levam o grafo sem a instrumentação
+    estado = object.__reduce_ex__(self, 2)[2]
+    return _restaurar, (type(self)._original, estado)
+
+
+def _copiar(self):
+    # copy.copy (GrafoVersionado) também leva o grafo sem a instrumentação
+    novo = type(self)._original.__copy__(self)
+    novo.__class__ = type(self)._original
+    return novo
+
+
+def _restaurar(classe: type, estado):
+    grafo = classe.__new__(classe)
+    if hasattr(grafo, "__setstate__"):
+        grafo.__setstate__(estado)
+    elif estado is not None:
+        # estado padrão: dicionário ou (dicionário, slots)
+        for atributos in (estado if isinstance(estado, tuple) else (estado,)):
+            for nome, valor in (atributos or {}).items():
+                setattr(grafo, nome, valor)
+    return grafo
+
+
+@functools.lru_cache(maxsize=None)
+def _classe_instrumentada(classe: type) -> type:
+    """
+    Monta (uma vez por classe) a subclasse com os métodos medidos.
+
+    Passos:
+    1. Envolver cada método público da classe (e das bases) com '_medir'.
+    2. Envolver os métodos de expansão/nível/percurso com os contadores de
+       tocados (a regra da classe mais derivada vale).
+    3. Criar a subclasse sem slots novos, para que o '__class__' de uma
+       instância possa ser trocado por ela (inclusive com __slots__).
+    """
+    atributos = {"__slots__": (), "_original": classe, "__reduce_ex__": _reduce_ex}
+    if hasattr(classe, "__copy__"):
+        atributos["__copy__"] = _copiar
+
+    # 1. Métodos públicos
+    for base in reversed(classe.__mro__[:-1]):
+        for nome, valor in vars(base).items():
+            if not nome.startswith("_") and isinstance(valor, FunctionType):
+                atributos[nome] = _medir(nome, getattr(classe, nome))
+
+    # 2. Vértices e arestas tocados
+    for base in classe.__mro__:
+        for nome in _PERCURSOS.get(base.__name__, ()):
+            atributos.setdefault(nome, _contar_percurso(getattr(classe, nome)))
+        for nome in _NIVEIS.get(base.__name__, ()):
+            atributos.setdefault(nome, _contar_nivel(getattr(classe, nome)))
+        for nome in _EXPANSOES.get(base.__name__, ()):
+            atributos.setdefault(nome, _contar_expansao(getattr(classe, nome)))
+        if base.__name__ in _EXPANSOES:
+            break
+
+    # 3. Subclasse
+    return type(f"{classe.__name__}Instrumentado", (classe,), atributos)
+
+
+def instrumentar(grafo, gancho: Optional[Gancho] = None, amostras: int = 1024) -> Metricas:
+    """
+    Liga a instrumentação em um grafo (Grafo, GrafoNumpy, GrafoBits,
+    GrafoListaAdj ou GrafoListaArestas) e retorna suas 'Metricas'.
+
+    A classe do objeto é trocada por uma subclasse própria dele, com os
+    métodos medidos; grafos não instrumentados continuam usando a classe
+    original, sem nenhum custo extra. 'gancho', se informado, é chamado ao
+    fim de cada chamada pública. Se o grafo já estiver instrumentado,
+    retorna as métricas existentes.
+    """
+    atuais = metricas(grafo)
+    if atuais is not None:
+        return atuais
+
+    classe = type(grafo)
+    nova = Metricas(gancho, amostras)
+    grafo.__class__ = type(classe.__name__, (_classe_instrumentada(classe),), {"__slots__": (), "_metricas": nova})
+    return nova
+
+
+def desinstrumentar(grafo) -> Optional[Metricas]:
+    """
+    Devolve o grafo à sua classe original e retorna as métricas coletadas
+    (ou None se ele não estava instrumentado).
+    """
+    atuais = metricas(grafo)
+    if atuais is not None:
+        grafo.__class__ = type(grafo)._original
+    return atuais
+
+
+def metricas(grafo) -> Optional[Metricas]:
+    """
+    Retorna as métricas de um grafo instrumentado, ou None.
+    """
+    return getattr(type(grafo), "_metricas", None)
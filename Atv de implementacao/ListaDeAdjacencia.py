@@ -1,61 +1,291 @@
+import copy
+from array import array
+
+if __name__ == "__main__" and not __package__:
+    # Rodado como arquivo ('python ListaDeAdjacencia.py'): as importações relativas
+    # abaixo só funcionam no pacote, então roda como 'grafos.ListaDeAdjacencia'
+    import _direto
+    _direto.rodar(__file__)
+
+from .Rotulos import TabelaRotulos
+
+# Linhas com mais ids que isto viram dicionário {id: None}: pertinência,
+# inserção e remoção O(1) nos vértices de grau alto (hubs), mantendo a ordem
+LIMITE_ARRAY = 64
+
+
+def _acrescentar(linhas, k, j):
+    # põe o id 'j' no fim da linha k (que ainda não o tem)
+    linha = linhas[k]
+    if type(linha) is dict:
+        linha[j] = None
+    else:
+        linha.append(j)
+        if len(linha) > LIMITE_ARRAY:
+            linhas[k] = dict.fromkeys(linha)
+
+
+def _retirar(linha, j):
+    # tira o id 'j' (presente) da linha
+    if type(linha) is dict:
+        del linha[j]
+    else:
+        linha.remove(j)
+
+
+def _traduzir(linha, traduzir):
+    # mesma linha (e mesmo tipo) com cada id passado por 'traduzir'
+    if type(linha) is dict:
+        return dict.fromkeys(map(traduzir, linha))
+    return array('i', map(traduzir, linha))
+
+
 class GrafoListaAdj:
+    __slots__ = ("_rotulos", "_saidas", "_entradas", "_pesos", "_vagos", "_uniao")
+
     def __init__(self):
         """
         Retorna um novo grafo vazio.
         Passos:
         1. Criar um dicionário vazio: {}
         2. Retornar o dicionário (representa o grafo)
+
+        Internamente cada vértice é um id inteiro denso 0..V-1 (veja
+        TabelaRotulos), e os vizinhos de cada id ficam em um array('i') na
+        ordem de inserção (4 bytes por aresta, em vez de uma entrada de
+        dicionário com ponteiros para o rótulo e para o peso). Uma linha que
+        passa de LIMITE_ARRAY ids vira um dicionário {id: None}, então
+        procurar, inserir e remover uma aresta custa O(1) mesmo em vértices
+        com muitos vizinhos. '_entradas' guarda o índice reverso: para cada
+        id, os ids que apontam para ele.
+        Os rótulos só aparecem na interface (vizinhos, exibir_grafo, ...).
+        """
+        self._rotulos = TabelaRotulos()
+        self._saidas = []
+        self._entradas = []
+        # pesos diferentes de 1: _pesos[origem][destino] = peso (em ids)
+        self._pesos = {}
+        # ids de vértices removidos (linhas None) ainda não compactados
+        self._vagos = 0
+        # união e busca dos componentes (montada só quando consultada)
+        self._uniao = None
+
+    @property
+    def grafo(self):
         """
-        self.grafo = {}
+        O grafo no formato de dicionário {vertice: {vizinho: peso}}, montado
+        a cada acesso (uma cópia: alterá-la não altera o grafo).
+        """
+        rotulos = self._rotulos.rotulos
+        return {rotulos[i]: {rotulos[j]: self._peso(i, j) for j in self._saidas[i]}
+                for i in self._vivos()}
+
+    def _vivos(self):
+        # ids dos vértices existentes, na ordem de inserção
+        return (i for i, linha in enumerate(self._saidas) if linha is not None)
+
+    def _peso(self, i, j):
+        return self._pesos.get(i, {}).get(j, 1)
 
     def inserir_vertice(self, vertice):
         """
         Insere um vértice no grafo, sem arestas iniciais.
         Passos:
         1. Verificar se 'vertice' já é chave em grafo.
-        2. Se não for, criar entrada grafo[vertice] = []
+        2. Se não for, criar entrada grafo[vertice] = {} (e o índice reverso)
         3. Se já existir, não fazer nada (ou avisar)
         """
-        if vertice not in self.grafo:
-            self.grafo[vertice] = []
+        self._id(vertice)
 
-    def inserir_aresta(self, origem, destino, nao_direcionado=False):
+    def _id(self, vertice):
+        # id de 'vertice', criando as linhas vazias se ele for novo
+        i = self._rotulos.indice(vertice)
+        if i == len(self._saidas):
+            self._saidas.append(array('i'))
+            self._entradas.append(array('i'))
+            if self._uniao is not None:
+                self._uniao.adicionar(i)
+        return i
+
+    def inserir_aresta(self, origem, destino, nao_direcionado=False, peso=1):
         """
         Adiciona aresta entre origem e destino.
         Passos:
         1. Garantir que 'origem' e 'destino' existam no grafo (inserir se necessário).
-        2. adicionar destino como vizinho de origem (append).
+        2. adicionar destino como vizinho de origem, com o peso (e origem como entrada de destino).
         3. Se for Nâo Direcionado, também:
              - adicionar origem como vizinho de destino
+        Se a aresta já existir, só o peso é atualizado.
         """
+        if peso < 0:
+            raise ValueError("o peso da aresta não pode ser negativo")
+
         # 1. Garantir que 'origem' e 'destino' existam no grafo (inserir se necessário).
-        self.inserir_vertice(origem)
-        self.inserir_vertice(destino)
+        i = self._id(origem)
+        j = self._id(destino)
 
-        # 2. adicionar destino como vizinho de origem (append).
-        if destino not in self.grafo[origem]:
-            self.grafo[origem].append(destino)
+        # 2. adicionar destino como vizinho de origem.
+        self._ligar(i, j, peso)
+        if self._uniao is not None:
+            self._uniao.unir(i, j)
 
         # 3. Se for Não Direcionado, também:
         #      - adicionar origem como vizinho de destino
         if nao_direcionado:
-            if origem not in self.grafo[destino]:
-                self.grafo[destino].append(origem)
+            self._ligar(j, i, peso)
+
+    def _ligar(self, i, j, peso):
+        # aresta i -> j com 'peso' (só o peso muda se ela já existir)
+        if j not in self._saidas[i]:
+            _acrescentar(self._saidas, i, j)
+            _acrescentar(self._entradas, j, i)
+        if peso != 1:
+            self._pesos.setdefault(i, {})[j] = peso
+        elif i in self._pesos:
+            self._pesos[i].pop(j, None)
+            if not self._pesos[i]:
+                del self._pesos[i]
+
+    def inserir_arestas_em_lote(self, arestas, nao_direcionado=False):
+        """
+        Adiciona várias arestas (pares origem, destino) de uma vez.
+        Passos:
+        1. Para cada par, criar as entradas de origem e destino se não existirem.
+        2. Adicionar destino como vizinho de origem, com peso 1 (arestas
+           repetidas são descartadas e as que já existiam mantêm o peso).
+        3. Se for Não Direcionado, adicionar também origem como vizinho de destino.
+
+        Os pares são traduzidos para ids e agrupados por origem; as repetidas
+        são descartadas com um conjunto por linha tocada, então o lote custa
+        O(E) mesmo com vértices de grau alto.
+        """
+        indices = self._rotulos.indices
+        indice = self._rotulos.indice
+        saidas = self._saidas
+        entradas = self._entradas
+        uniao = self._uniao
+        n_antes = len(saidas)
+        novos = {}
+
+        for origem, destino in arestas:
+            # 1. Traduzir para ids (os vértices novos ganham linhas abaixo)
+            i = indices.get(origem)
+            if i is None:
+                i = indice(origem)
+            j = indices.get(destino)
+            if j is None:
+                j = indice(destino)
+
+            # 2. e 3. Agrupar os pares pela origem
+            novos.setdefault(i, []).append(j)
+            if nao_direcionado:
+                novos.setdefault(j, []).append(i)
+
+        # 1. Linhas vazias dos vértices novos
+        for i in range(n_antes, len(self._rotulos.rotulos)):
+            saidas.append(array('i'))
+            entradas.append(array('i'))
+            if uniao is not None:
+                uniao.adicionar(i)
+
+        # 2. e 3. Acrescentar cada destino ainda não ligado à linha da origem
+        for i, destinos in novos.items():
+            vistos = set(saidas[i])
+            for j in destinos:
+                if j not in vistos:
+                    vistos.add(j)
+                    _acrescentar(saidas, i, j)
+                    _acrescentar(entradas, j, i)
+                    if uniao is not None:
+                        uniao.unir(i, j)
+
+    @classmethod
+    def de_arestas(cls, arestas, nao_direcionado=False):
+        """
+        Cria um grafo já com as arestas informadas (veja 'inserir_arestas_em_lote').
+        """
+        g = cls()
+        g.inserir_arestas_em_lote(arestas, nao_direcionado)
+        return g
+
+    def __copy__(self):
+        """
+        Retorna uma cópia independente do grafo (alterar uma não muda a
+        outra): uma linha nova de vizinhos (e de entradas) por vértice, com
+        os mesmos rótulos. Bem mais barato que copy.deepcopy.
+        """
+        novo = object.__new__(type(self))
+        novo._rotulos = copy.copy(self._rotulos)
+        novo._saidas = [copy.copy(linha) for linha in self._saidas]
+        novo._entradas = [copy.copy(linha) for linha in self._entradas]
+        novo._pesos = {i: dict(pesos) for i, pesos in self._pesos.items()}
+        novo._vagos = self._vagos
+        novo._uniao = copy.copy(self._uniao)
+        return novo
 
     def vizinhos(self, vertice):
         """
         Retorna a lista de vizinhos de 'vertice'.
         Passos:
-        1. Se 'vertice' estiver em grafo, retornar grafo[vertice] (lista).
+        1. Se 'vertice' estiver em grafo, retornar os vizinhos em grafo[vertice] (lista).
         2. Se não existir, retornar lista vazia ou sinalizar erro.
         """
-        # 1. Se 'vertice' estiver em grafo, retornar grafo[vertice] (lista).
-        if vertice in self.grafo:
-            return self.grafo[vertice]
-        
+        # 1. Se 'vertice' estiver em grafo, traduzir os ids da sua linha para rótulos.
+        i = self._rotulos.indices.get(vertice)
+        if i is not None:
+            return list(map(self._rotulos.rotulos.__getitem__, self._saidas[i]))
+
         # 2. Se não existir, retornar lista vazia.
         return []
 
+    def peso_aresta(self, origem, destino):
+        """
+        Retorna o peso da aresta origem -> destino, ou None se ela não existir.
+        """
+        i = self._rotulos.procurar(origem)
+        j = self._rotulos.procurar(destino)
+        if i is None or j is None or j not in self._saidas[i]:
+            return None
+        return self._peso(i, j)
+
+    def _vizinhos_com_pesos(self, i):
+        # pares (id do vizinho, peso) das arestas que saem do id 'i'
+        pesos = self._pesos.get(i, {})
+        return [(j, pesos.get(j, 1)) for j in self._saidas[i]]
+
+    def _caminho_ponderado(self, busca, inicio, destino, *heuristica):
+        # roda a busca de Caminhos em ids e traduz o caminho para rótulos
+        s = self._rotulos.procurar(inicio)
+        t = self._rotulos.procurar(destino)
+        if s is None or t is None:
+            return None
+        resultado = busca(self._vizinhos_com_pesos, s, t, *heuristica)
+        if resultado is None:
+            return None
+        caminho, custo = resultado
+        rotulos = self._rotulos.rotulos
+        return [rotulos[i] for i in caminho], custo
+
+    def dijkstra(self, inicio, destino):
+        """
+        Menor caminho ponderado (algoritmo de Dijkstra com heap, veja
+        Caminhos.dijkstra), parando ao chegar em 'destino'.
+        Retorna (caminho, custo) ou None.
+        """
+        from .Caminhos import dijkstra
+
+        return self._caminho_ponderado(dijkstra, inicio, destino)
+
+    def a_estrela(self, inicio, destino, heuristica):
+        """
+        Menor caminho ponderado com A*: 'heuristica(v)' estima o custo de v
+        até 'destino' (veja Caminhos.a_estrela). Retorna (caminho, custo) ou None.
+        """
+        from .Caminhos import a_estrela
+
+        rotulos = self._rotulos.rotulos
+        return self._caminho_ponderado(a_estrela, inicio, destino, lambda i: heuristica(rotulos[i]))
+
     def listar_vizinhos(self, vertice):
         """
         Função semântica: imprimir/retornar os vizinhos de 'vertice'.
@@ -67,11 +297,11 @@ class GrafoListaAdj:
         lista_vizinhos = self.vizinhos(vertice)
 
         # 2. Retornar/imprimir essa lista (ou informar que o vértice não existe)
-        if vertice in self.grafo:
+        if vertice in self._rotulos:
             print(f"Vizinhos de '{vertice}': {lista_vizinhos}")
         else:
             print(f"O vértice '{vertice}' não existe no grafo.")
-        
+
         return lista_vizinhos
 
     def exibir_grafo(self):
@@ -81,14 +311,15 @@ class GrafoListaAdj:
         1. Para cada vertice em ordem
              - imprimir: vertice -> vizinhos
         """
-        if not self.grafo:
+        if not self._rotulos.indices:
             print("O grafo está vazio.")
             return
-        
+
         print("\nLista de Adjacência:")
         # 1. Para cada vertice em ordem - imprimir: vertice -> vizinhos
-        for v, vizinhos in self.grafo.items():
-            print(f"{v} -> {vizinhos}")
+        rotulos = self._rotulos.rotulos
+        for i in self._vivos():
+            print(f"{rotulos[i]} -> {[rotulos[j] for j in self._saidas[i]]}")
 
     def remover_aresta(self, origem, destino, nao_direcionado=False):
         """
@@ -100,40 +331,97 @@ class GrafoListaAdj:
              - verificar se 'destino' existe e remover 'origem' de grafo[destino] se presente.
         """
         # 1. Verificar se 'origem' existe; se não, terminar.
-        if origem not in self.grafo:
+        i = self._rotulos.procurar(origem)
+        if i is None:
+            return
+        j = self._rotulos.procurar(destino)
+        if j is None:
             return
 
         # 2. Se destino estiver em grafo[origem], remover essa ocorrência.
-        if destino in self.grafo[origem]:
-            self.grafo[origem].remove(destino)
+        if self._desligar(i, j):
+            self._uniao = None
 
         # 3. Se for não direcionado, também:
         #      - verificar se 'destino' existe e remover 'origem' de grafo[destino] se presente.
-        if nao_direcionado and destino in self.grafo and origem in self.grafo[destino]:
-            self.grafo[destino].remove(origem)
+        if nao_direcionado and self._desligar(j, i):
+            self._uniao = None
+
+    def _desligar(self, i, j):
+        # remove a aresta i -> j; retorna False se ela não existia
+        if j not in self._saidas[i]:
+            return False
+        _retirar(self._saidas[i], j)
+        _retirar(self._entradas[j], i)
+        if i in self._pesos:
+            self._pesos[i].pop(j, None)
+            if not self._pesos[i]:
+                del self._pesos[i]
+        return True
 
     def remover_vertice(self, vertice, nao_direcionado=True):
         """
         Remove um vértice e todas as arestas que o tocam.
         Passos:
         1. Verificar se 'vertice' existe em grafo; se não, terminar.
-        2. Para cada outro vertice no grafo:
-             - se 'vertice' estiver na lista de vizinhos, remover essa aresta.
-        3. Remover o vertice do grafo
+        2. Para cada vertice que aponta para ele (índice reverso):
+             - remover essa aresta.
+        3. Remover o vertice do grafo (e do índice reverso dos seus vizinhos)
         4. Opcional: retornar confirmação/erro.
+
+        O id do vértice fica vago (linhas None) e os demais não mudam, então
+        a remoção custa O(grau) (cada vizinho perde um id). Quando mais
+        da metade dos ids estiver vaga, os ids são renumerados de uma vez
+        (O(V + E), amortizado entre as remoções).
         """
         # 1. Verificar se 'vertice' existe em grafo; se não, terminar.
-        if vertice not in self.grafo:
+        i = self._rotulos.procurar(vertice)
+        if i is None:
             return
 
-        # 2. Para cada outro vertice no grafo:
-        #      - se 'vertice' estiver na lista de vizinhos, remover essa aresta.
-        for chave in self.grafo.keys():
-            if vertice in self.grafo[chave] and chave != vertice:
-                self.grafo[chave].remove(vertice)
+        # 2. Para cada vertice que aponta para ele: remover essa aresta.
+        for chave in self._entradas[i]:
+            if chave != i:
+                _retirar(self._saidas[chave], i)
+                if chave in self._pesos:
+                    self._pesos[chave].pop(i, None)
+                    if not self._pesos[chave]:
+                        del self._pesos[chave]
 
         # 3. Remover o vertice do grafo
-        del self.grafo[vertice]
+        for vizinho in self._saidas[i]:
+            if vizinho != i:
+                _retirar(self._entradas[vizinho], i)
+        self._saidas[i] = None
+        self._entradas[i] = None
+        self._pesos.pop(i, None)
+        # o rótulo sai do mapa (e pode voltar com um id novo); a posição
+        # dele na lista da tabela fica até a próxima compactação
+        del self._rotulos.indices[vertice]
+        self._vagos += 1
+        self._uniao = None
+        if 2 * self._vagos > len(self._saidas):
+            self._compactar()
+
+    def _novos_ids(self):
+        # id antigo -> id sem os vagos (-1 para os vagos)
+        novos = [-1] * len(self._saidas)
+        for k, i in enumerate(self._vivos()):
+            novos[i] = k
+        return novos
+
+    def _compactar(self):
+        # Renumera os ids sem os vagos, mantendo a ordem de inserção
+        novos = self._novos_ids()
+        traduzir = novos.__getitem__
+        vivos = list(self._vivos())
+        rotulos = self._rotulos.rotulos
+        self._rotulos = TabelaRotulos(rotulos[i] for i in vivos)
+        self._saidas = [_traduzir(self._saidas[i], traduzir) for i in vivos]
+        self._entradas = [_traduzir(self._entradas[i], traduzir) for i in vivos]
+        self._pesos = {novos[i]: {novos[j]: peso for j, peso in pesos.items()}
+                       for i, pesos in self._pesos.items()}
+        self._vagos = 0
 
     def existe_aresta(self, origem, destino):
         """
@@ -141,10 +429,16 @@ class GrafoListaAdj:
         Passos:
         1. Verificar se 'origem' é chave no grafo.
         2. Retornar True se 'destino' estiver em grafo[origem], caso contrário False.
+
+        A busca custa O(1) nas linhas de dicionário e no máximo LIMITE_ARRAY
+        comparações (em C) nas de array.
         """
         # 1. Verificar se 'origem' é chave no grafo.
         # 2. Retornar True se 'destino' estiver em grafo[origem], caso contrário False.
-        return origem in self.grafo and destino in self.grafo[origem]
+        indices = self._rotulos.indices
+        i = indices.get(origem)
+        j = indices.get(destino)
+        return i is not None and j is not None and j in self._saidas[i]
 
     def grau_vertices(self):
         """
@@ -154,28 +448,23 @@ class GrafoListaAdj:
         2. Para cada vertice, colocar no dict uma estrutura com in, out e total zerado
         3. Para cada u em grafo:
              - out_degree[u] = tamanho de vizinhos
-             - para cada v em grafo:
-               - verificar se u está na lista de vizinho de v,
-               - caso esteja, adicionar +1 para o grau de entrada de u
+             - in_degree[u] = tamanho do índice reverso de u
         4. Calcular o grau total somando entrada + saida
         5. Retornar uma estrutura contendo out,in,total por vértice (ex: dict de tuplas).
+
+        As duas linhas de cada vértice já são mantidas por inserir_aresta,
+        remover_aresta e remover_vertice, então o grau de cada vértice é O(1).
         """
         graus = {}
-        
-        # 1. e 2. Inicializar dict e para cada vertice, colocar estrutura com in, out e total zerado
-        for v in self.grafo:
-            graus[v] = {"entrada": 0, "saida": len(self.grafo[v]), "total": 0}
-
-        # 3. Calcular grau de entrada (in_degree)
-        for u in self.grafo:
-            for v_vizinho in self.grafo[u]:
-                if v_vizinho in graus:
-                    graus[v_vizinho]["entrada"] += 1
-
-        # 4. Calcular o grau total somando entrada + saida
-        for v in graus:
-            graus[v]["total"] = graus[v]["entrada"] + graus[v]["saida"]
-            
+        rotulos = self._rotulos.rotulos
+
+        # 1. a 4. Para cada vertice, ler os tamanhos mantidos pelas inserções/remoções
+        for i in self._vivos():
+            v = rotulos[i]
+            saida = len(self._saidas[i])
+            entrada = len(self._entradas[i])
+            graus[v] = {"entrada": entrada, "saida": saida, "total": entrada + saida}
+
         # 5. Retornar a estrutura
         return graus
 
@@ -197,14 +486,111 @@ class GrafoListaAdj:
         # 2. Para i de 0 até len(caminho)-2:
         for i in range(len(caminho) - 1):
             origem, destino = caminho[i], caminho[i + 1]
-            
+
             # - se não existe_aresta(grafo, origem, destino): retornar False
             if not self.existe_aresta(origem, destino):
                 return False
-        
+
         # 3. Se todas as arestas existirem, retornar True.
         return True
 
+    def existe_arestas(self, pares):
+        """
+        Versão em lote de 'existe_aresta': uma busca na linha da origem por
+        par. Retorna um booleano por par (origem, destino).
+        """
+        indices = self._rotulos.indices
+        saidas = self._saidas
+        resultado = []
+        for origem, destino in pares:
+            i = indices.get(origem)
+            j = indices.get(destino)
+            resultado.append(i is not None and j is not None and j in saidas[i])
+        return resultado
+
+    def percursos_validos(self, caminhos):
+        """
+        Versão em lote de 'percurso_valido': um booleano por caminho. A
+        verificação de um caminho para no primeiro passo que não existe.
+        """
+        indices = self._rotulos.indices
+        saidas = self._saidas
+
+        def passo(origem, destino):
+            i = indices.get(origem)
+            j = indices.get(destino)
+            return i is not None and j is not None and j in saidas[i]
+
+        return [all(passo(origem, destino) for origem, destino in zip(caminho, caminho[1:]))
+                for caminho in caminhos]
+
+    def _uniao_busca(self):
+        # Montada na primeira consulta de componentes; daí em diante as
+        # inserções a atualizam e as remoções a descartam
+        if self._uniao is None:
+            from .Componentes import uniao_das_arestas
+            self._uniao = uniao_das_arestas(self._vivos(), self._saidas.__getitem__)
+        return self._uniao
+
+    def mesma_componente(self, a, b):
+        """
+        True se 'a' e 'b' estão no mesmo componente conexo (ignorando a
+        direção das arestas). Usa a união e busca (veja Componentes.UniaoBusca),
+        então cada consulta custa O(α(V)) enquanto só houver inserções.
+        """
+        i = self._rotulos.procurar(a)
+        j = self._rotulos.procurar(b)
+        if i is None or j is None:
+            return False
+        return self._uniao_busca().conectados(i, j)
+
+    def numero_componentes(self):
+        """
+        Número de componentes conexos (ignorando a direção das arestas).
+        """
+        return self._uniao_busca().componentes
+
+    def componentes(self):
+        """
+        Componentes conexos (ignorando a direção das arestas), cada um com
+        os vértices na ordem de inserção.
+        """
+        rotulos = self._rotulos.rotulos
+        return [[rotulos[i] for i in grupo] for grupo in self._uniao_busca().grupos()]
+
+    def componentes_fortemente_conexas(self):
+        """
+        Componentes fortemente conexas (Tarjan iterativo, veja
+        Componentes.componentes_fortemente_conexas).
+        """
+        from .Componentes import componentes_fortemente_conexas
+
+        rotulos = self._rotulos.rotulos
+        grupos = componentes_fortemente_conexas(self._vivos(), self._saidas.__getitem__)
+        return [[rotulos[i] for i in grupo] for grupo in grupos]
+
+    def congelar(self):
+        """
+        Retorna uma cópia imutável do grafo no formato CSR (veja GrafoCSR),
+        para consultas de leitura.
+        Passos:
+        1. Numerar os vértices na ordem de inserção (os próprios ids, sem
+           os vagos deixados por remover_vertice).
+        2. Copiar a linha de ids de cada vértice, traduzida se houver vagos.
+        """
+        from .FormatoCSR import GrafoCSR
+
+        # 1. Numerar os vértices
+        vivos = list(self._vivos())
+        rotulos = [self._rotulos.rotulos[i] for i in vivos]
+
+        # 2. Linhas em ids
+        if not self._vagos:
+            return GrafoCSR.de_listas(rotulos, self._saidas, direcionado=True)
+        traduzir = self._novos_ids().__getitem__
+        linhas = (map(traduzir, self._saidas[i]) for i in vivos)
+        return GrafoCSR.de_listas(rotulos, linhas, direcionado=True)
+
 
 def criar_grafo():
     """
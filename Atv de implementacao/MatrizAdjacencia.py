@@ -1,6 +1,35 @@
-from typing import List, Tuple, Optional, Dict, Any
+import copy
+from collections import deque
+from typing import List, Tuple, Optional, Dict
+
+if __name__ == "__main__" and not __package__:
+    # Rodado como arquivo ('python MatrizAdjacencia.py'): as importações relativas
+    # abaixo só funcionam no pacote, então roda como 'grafos.MatrizAdjacencia'
+    import _direto
+    _direto.rodar(__file__)
+
+from .Rotulos import TabelaRotulos
+
+# O motor NumPy é opcional e o numpy só é importado quando um GrafoNumpy
+# é criado (ou desserializado), para quem usa só o Grafo não pagar por ele.
+np = None
+
+
+def _importar_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("GrafoNumpy requer o pacote numpy") from None
+        np = numpy
+    return np
+
 
 class Grafo:
+    __slots__ = ("direcionado", "matriz", "vertices", "indices", "_rotulos",
+                 "_grau_saida", "_grau_entrada", "_pesos", "_versao", "_cache", "_uniao")
+
     def __init__(self, direcionado:bool) -> None: #criar grafo
     # Cria e retorna uma matriz de adjacência vazia e uma lista de vértices.
 
@@ -10,7 +39,21 @@ class Grafo:
     # 3. Retornar (matriz, vertices).
         self.direcionado = direcionado
         self.matriz = []
-        self.vertices = []
+        # tabela rótulo <-> índice na matriz; 'vertices' e 'indices' são a
+        # lista e o mapa da própria tabela (consulta O(1))
+        self._rotulos = TabelaRotulos()
+        self.vertices: List[str] = self._rotulos.rotulos
+        self.indices: Dict[str, int] = self._rotulos.indices
+        # graus por índice, atualizados a cada mudança na matriz
+        self._grau_saida: List[int] = []
+        self._grau_entrada: List[int] = []
+        # pesos diferentes de 1: _pesos[origem][destino] = peso
+        self._pesos: Dict[str, Dict[str, float]] = {}
+        # versão do grafo: muda a cada alteração, invalidando o cache
+        self._versao = 0
+        self._cache = None
+        # união e busca dos componentes (montada só quando consultada)
+        self._uniao = None
 
     def inserir_vertice(self,  vertice:str):
         """
@@ -24,20 +67,18 @@ class Grafo:
                 a) Para cada linha existente, adicionar um valor 0 no final (nova coluna).
                 b) Adicionar uma nova linha com zeros do tamanho atualizado.
         """
-        if vertice in self.vertices:
+        if vertice in self.indices:
             return True
         
-        self.vertices.append(vertice)
-        for linha in self.matriz:
-            linha.append(0)
+        i = self._rotulos.indice(vertice)
+        self._grau_saida.append(0)
+        self._grau_entrada.append(0)
+        self._adicionar_indices(1)
+        if self._uniao is not None:
+            self._uniao.adicionar(i)
+        self._versao += 1
 
-        nova_linha = []
-        for i in range(len(self.vertices)):
-            nova_linha.append(0)
-
-        self.matriz.append(nova_linha)
-
-    def inserir_aresta(self, origem, destino):
+    def inserir_aresta(self, origem, destino, peso: float = 1):
         """
         Adiciona uma aresta entre dois vértices.
 
@@ -47,19 +88,122 @@ class Grafo:
         2. Localizar o índice da origem (i) e do destino (j).
         3. Marcar a conexão na matriz: matriz[i][j] = 1.
         4. Se nao_direcionado=True, também marcar a conexão inversa matriz[j][i] = 1.
+        5. Guardar o peso da aresta (a matriz continua 0/1; só pesos
+           diferentes de 1 ocupam espaço em '_pesos').
         """
-        if origem not in self.vertices:
+        if peso < 0:
+            raise ValueError("o peso da aresta não pode ser negativo")
+
+        if origem not in self.indices:
             self.inserir_vertice(origem)
-        if destino not in self.vertices:
+        if destino not in self.indices:
             self.inserir_vertice(destino)
         
-        i_origem = self.vertices.index(origem)
-        i_destino = self.vertices.index(destino)
+        i_origem = self.indices[origem]
+        i_destino = self.indices[destino]
 
-        self.matriz[i_origem][i_destino] = 1
+        self._marcar(i_origem, i_destino, 1)
+        self._definir_peso(origem, destino, peso)
 
         if not self.direcionado:
-            self.matriz[i_destino][i_origem] = 1
+            self._marcar(i_destino, i_origem, 1)
+            self._definir_peso(destino, origem, peso)
+
+    def _definir_peso(self, origem, destino, peso):
+        atual = self._pesos.get(origem, {}).get(destino, 1)
+        if atual == peso:
+            return
+        if peso == 1:
+            del self._pesos[origem][destino]
+            if not self._pesos[origem]:
+                del self._pesos[origem]
+        else:
+            self._pesos.setdefault(origem, {})[destino] = peso
+        self._versao += 1
+
+    def peso_aresta(self, origem, destino) -> Optional[float]:
+        """
+        Retorna o peso da aresta origem -> destino, ou None se ela não existir.
+        """
+        if not self.existe_aresta(origem, destino):
+            return None
+        return self._pesos.get(origem, {}).get(destino, 1)
+
+    def inserir_arestas_em_lote(self, arestas):
+        """
+        Adiciona várias arestas (pares origem, destino) de uma vez.
+
+        Passos:
+        1. Percorrer as arestas uma única vez:
+            - Traduzir cada rótulo para índice, registrando os vértices novos.
+            - Guardar o par de índices em um conjunto (descarta repetidas).
+            - Se não direcionado, guardar também o par inverso.
+        2. Aumentar a matriz uma única vez para todos os vértices novos.
+        3. Marcar cada par do conjunto na matriz.
+        """
+        indice = self._rotulos.indice
+        vertices = self.vertices
+        n_antes = len(vertices)
+        pares = set()
+
+        # 1. Traduzir os rótulos e juntar os pares
+        for origem, destino in arestas:
+            i = indice(origem)
+            j = indice(destino)
+            pares.add((i, j))
+            if not self.direcionado:
+                pares.add((j, i))
+
+        # 2. Aumentar a matriz de uma vez
+        novos = len(vertices) - n_antes
+        if novos:
+            self._grau_saida.extend([0] * novos)
+            self._grau_entrada.extend([0] * novos)
+            self._adicionar_indices(novos)
+            if self._uniao is not None:
+                for i in range(n_antes, len(vertices)):
+                    self._uniao.adicionar(i)
+            self._versao += 1
+
+        # 3. Marcar as conexões
+        for i, j in pares:
+            self._marcar(i, j, 1)
+
+    @classmethod
+    def de_arestas(cls, arestas, direcionado: bool):
+        """
+        Cria um grafo já com as arestas informadas (veja 'inserir_arestas_em_lote').
+        """
+        g = cls(direcionado)
+        g.inserir_arestas_em_lote(arestas)
+        return g
+
+    def __copy__(self):
+        """
+        Retorna uma cópia independente do grafo (alterar uma não muda a
+        outra), copiando só as estruturas do grafo: linhas da matriz,
+        tabela de rótulos, graus e pesos. Os rótulos em si são compartilhados.
+        Bem mais barato que copy.deepcopy, que visita cada célula como um
+        objeto. Com o cache ligado, a cópia começa com um cache vazio.
+        """
+        novo = object.__new__(type(self))
+        novo.direcionado = self.direcionado
+        novo._rotulos = copy.copy(self._rotulos)
+        novo.vertices = novo._rotulos.rotulos
+        novo.indices = novo._rotulos.indices
+        novo._grau_saida = list(self._grau_saida)
+        novo._grau_entrada = list(self._grau_entrada)
+        novo._pesos = {origem: dict(pesos) for origem, pesos in self._pesos.items()}
+        novo._versao = self._versao
+        novo._cache = None
+        if self._cache is not None:
+            novo.ativar_cache(self._cache.capacidade)
+        novo._uniao = copy.copy(self._uniao)
+        self._copiar_matriz(novo)
+        return novo
+
+    def _copiar_matriz(self, novo):
+        novo.matriz = [linha[:] for linha in self.matriz]
 
     def remover_vertice(self, vertice):
         """
@@ -68,15 +212,31 @@ class Grafo:
         Passos:
         1. Verificar se o vértice existe em 'vertices'.
         2. Caso exista:
-            - Descobrir o índice correspondente (usando vertices.index(vertice)).
+            - Descobrir o índice correspondente (usando indices[vertice]).
+            - Descontar suas arestas dos graus dos vizinhos.
             - Remover a linha da matriz na posição desse índice.
             - Remover a coluna (mesmo índice) de todas as outras linhas.
-            - Remover o vértice da lista 'vertices'.
+            - Remover o vértice da lista 'vertices' e do mapa 'indices'.
+            - Atualizar o índice dos vértices que vinham depois dele.
         """
-        i = self.vertices.index(vertice)
-        del self.matriz[i]
-        for linha in self.matriz:
-            del linha[i]
+        if vertice not in self.indices:
+            return
+
+        i = self.indices[vertice]
+        for j in self._saidas(i):
+            self._grau_entrada[j] -= 1
+        for k in self._predecessores(i):
+            self._grau_saida[k] -= 1
+            if self._pesos:
+                self._definir_peso(self.vertices[k], vertice, 1)
+        self._pesos.pop(vertice, None)
+        del self._grau_saida[i]
+        del self._grau_entrada[i]
+        self._remover_indice(i)
+
+        self._rotulos.remover(vertice)
+        self._uniao = None
+        self._versao += 1
 
     def remover_aresta(self,origem, destino):
         """
@@ -88,15 +248,17 @@ class Grafo:
         3. Remover a aresta: matriz[i][j] = 0.
         4. Se nao_direcionado=True, também remover a inversa: matriz[j][i] = 0.
         """
-        if origem not in self.vertices or destino not in self.vertices:
+        if origem not in self.indices or destino not in self.indices:
             return
 
-        i_origem = self.vertices.index(origem)
-        i_destino = self.vertices.index(destino)
-        self.matriz[i_origem][i_destino] = 0
+        i_origem = self.indices[origem]
+        i_destino = self.indices[destino]
+        self._marcar(i_origem, i_destino, 0)
+        self._definir_peso(origem, destino, 1)
 
         if not self.direcionado:
-            self.matriz[i_destino][i_origem] = 0
+            self._marcar(i_destino, i_origem, 0)
+            self._definir_peso(destino, origem, 1)
 
     def existe_aresta(self, origem, destino) -> bool:
         """
@@ -107,13 +269,13 @@ class Grafo:
         2. Obter os índices (i, j).
         3. Retornar True se matriz[i][j] == 1, caso contrário False.
         """
-        if origem not in self.vertices or destino not in self.vertices:
+        if origem not in self.indices or destino not in self.indices:
             return False
         
-        i_origem = self.vertices.index(origem)
-        i_destino = self.vertices.index(destino)
+        i_origem = self.indices[origem]
+        i_destino = self.indices[destino]
 
-        existe = self.matriz[i_origem][i_destino] == 1 
+        existe = self._obter(i_origem, i_destino) == 1
         return existe
         
     def vizinhos(self, vertice):
@@ -128,28 +290,34 @@ class Grafo:
             - Adicionar o vértice correspondente na lista de vizinhos
         5. Retornar essa lista.
         """
-        if vertice not in self.vertices:
+        if vertice not in self.indices:
             return []
-        
+
+        if self._cache is not None:
+            chave = ("vizinhos", vertice, self._versao)
+            vizinhos = self._cache.obter(chave)
+            if vizinhos is None:
+                vizinhos = self._vizinhos(vertice)
+                self._cache.guardar(chave, vizinhos)
+            return list(vizinhos)
+
+        return self._vizinhos(vertice)
+
+    def _vizinhos(self, vertice):
         vizinhos = []
-        i = self.vertices.index(vertice)
-        linha_vizinhos = self.matriz[i]
+        i = self.indices[vertice]
         
         # Percorrer a linha 'i' para encontrar as saídas
-        for j, conexao in enumerate(linha_vizinhos):
-            if conexao == 1:
-                vizinhos.append(self.vertices[j])
+        for j in self._saidas(i):
+            vizinhos.append(self.vertices[j])
 
         return sorted(vizinhos)
 
     def entradas(self, vertice): 
-        if vertice not in self.vertices:
+        if vertice not in self.indices:
             return []
-        j = self.vertices.index(vertice)
-        coluna = []
-        for v in self.matriz:
-            coluna.append(v[j])
-        return coluna
+        j = self.indices[vertice]
+        return self._coluna(j)
 
     def grau_vertices(self):
         """
@@ -159,21 +327,24 @@ class Grafo:
         1. Criar um dicionário vazio 'graus'.
         2. Para cada vértice i:
             - Se o grafo for direcionado:
-                - Grau de saída: somar os valores da linha i.
-                - Grau de entrada: somar os valores da coluna i.
+                - Grau de saída: contador de saída de i (soma da linha i).
+                - Grau de entrada: contador de entrada de i (soma da coluna i).
                 - Grau total = entrada + saída.
             - Se não:
                 - calcular apenas o grau de saida ou entrada
         3. Armazenar no dicionário no formato:
             graus[vértice] = {"saida": x, "entrada": y, "total": z} ou graus[vértice] = x.
         4. Retornar 'graus'.
+
+        Os contadores são mantidos por inserir_aresta, remover_aresta e
+        remover_vertice, então a tabela sai em O(V) sem ler a matriz.
         """
         graus = {}
         if self.direcionado:
             for index_vertice in range(len(self.vertices)):
                 v = self.vertices[index_vertice]
-                saida = sum(self.matriz[index_vertice])
-                entrada = sum(self.entradas(v))
+                saida = self._grau_saida[index_vertice]
+                entrada = self._grau_entrada[index_vertice]
                 graus[v] = {
                     "saida": saida,
                     "entrada": entrada,
@@ -182,7 +353,7 @@ class Grafo:
         else: #nao direcionado
             for index_vertice in range(len(self.vertices)):
                 v = self.vertices[index_vertice]
-                saida = sum(self.matriz[index_vertice])
+                saida = self._grau_saida[index_vertice]
                 graus[v] = saida
 
         return graus
@@ -197,12 +368,64 @@ class Grafo:
             - Verificar se existe_aresta(matriz, vertices, u, v) é True.
             - Se alguma não existir, retornar False.
         3. Se todas existirem, retornar True.
+
+        Para validar muitos caminhos, veja 'percursos_validos'.
         """
-        for i in range(len(caminho)-2):
+        for i in range(len(caminho)-1):
             if not self.existe_aresta(caminho[i], caminho[i+1]):
                 return False
         return True
 
+    def existe_arestas(self, pares) -> List[bool]:
+        """
+        Versão em lote de 'existe_aresta': uma resposta por par (origem, destino).
+
+        Passos:
+        1. Traduzir os rótulos de todos os pares para índices (-1 se o
+           vértice não existir).
+        2. Consultar todas as células de uma vez ('_existem'; no GrafoNumpy,
+           uma única indexação vetorizada do array).
+        """
+        indices = self.indices
+        origens, destinos = [], []
+        # 1. Rótulos -> índices
+        for origem, destino in pares:
+            origens.append(indices.get(origem, -1))
+            destinos.append(indices.get(destino, -1))
+        # 2. Todas as células de uma vez
+        return self._existem(origens, destinos)
+
+    def percursos_validos(self, caminhos) -> List[bool]:
+        """
+        Versão em lote de 'percurso_valido': uma resposta por caminho.
+
+        Passos:
+        1. Traduzir cada vértice de cada caminho para índice uma única vez
+           (-1 se não existir).
+        2. Juntar os passos (pares consecutivos) de todos os caminhos em
+           duas listas, guardando onde começam os passos de cada caminho.
+        3. Verificar todos os passos de uma vez ('_existem').
+        4. Um caminho é válido se todos os seus passos existem (caminhos
+           com menos de 2 vértices são válidos).
+        """
+        indices = self.indices
+        origens: List[int] = []
+        destinos: List[int] = []
+        limites = [0]
+        for caminho in caminhos:
+            # 1. Rótulos -> índices
+            ids = [indices.get(v, -1) for v in caminho]
+            # 2. Passos do caminho
+            origens.extend(ids[:-1])
+            destinos.extend(ids[1:])
+            limites.append(len(origens))
+
+        # 3. Todos os passos de uma vez
+        existe = self._existem(origens, destinos)
+
+        # 4. Resultado por caminho
+        return [all(existe[a:b]) for a, b in zip(limites, limites[1:])]
+
     def listar_vizinhos(self, vertice):
         """
         Exibe (ou retorna) os vizinhos de um vértice.
@@ -212,7 +435,7 @@ class Grafo:
         2. Chamar a função vizinhos() para obter a lista.
         3. Exibir a lista formatada (ex: print(f"Vizinhos de {v}: {lista}")).
         """
-        if vertice not in self.vertices:
+        if vertice not in self.indices:
             return []
         print(f"Vizinhos de {vertice}: {self.vizinhos(vertice)}")
 
@@ -227,8 +450,22 @@ class Grafo:
             - Mostrar os valores da linha (0 ou 1) separados por espaço.
         """
         print("  " + " ".join(self.vertices))
-        for i in self.matriz:
-            print(self.vertices[self.matriz.index(i)] +" " + " ".join([str(x) for x in i]))
+        for i in range(len(self.vertices)):
+            print(self.vertices[i] + " " + " ".join([str(x) for x in self._linha(i)]))
+
+    def congelar(self):
+        """
+        Retorna uma cópia imutável do grafo no formato CSR (veja GrafoCSR),
+        para consultas de leitura.
+
+        Passos:
+        1. Usar 'vertices' como tabela de rótulos.
+        2. Para cada índice i, usar as saídas da linha i como linha do CSR.
+        """
+        from .FormatoCSR import GrafoCSR
+
+        linhas = (self._saidas(i) for i in range(len(self.vertices)))
+        return GrafoCSR.de_listas(self.vertices, linhas, self.direcionado)
 
     def bfs(self, inicio: str = None) -> List[str]:
         """
@@ -249,113 +486,796 @@ class Grafo:
         if not self.vertices: return []
         
         # define o vértice inicial, se não for fornecido, usa o primeiro da lista
-        start_node = inicio if inicio in self.vertices else self.vertices[0]
-        
-        fila: List[str] = [start_node]
-        visitados: set[str] = {start_node}
-        ordem_visitados: List[str] = [start_node]
+        start_node = inicio if inicio in self.indices else self.vertices[0]
+
+        ordem, _ = self._arvore(self.indices[start_node])
 
-        while fila:
-            # a. Retirar o primeiro vértice da fila (FIFO)
-            vertice_atual = fila.pop(0)
-
-            # c. Obter os vizinhos do vértice (já ordenados pela função vizinhos)
-            for vizinho in self.vizinhos(vertice_atual):
-                # i. Verificar se o vizinho já não foi visitado
-                if vizinho not in visitados:
-                    # ii. Adicionar o vizinho na Fila e marcar como visitado
-                    visitados.add(vizinho)
-                    fila.append(vizinho)
-                    ordem_visitados.append(vizinho)
-        
         # 4. Retornar Visitados
-        return ordem_visitados
+        return [self.vertices[i] for i in ordem]
 
-    def menorCaminho(self, inicio: str, destino: str) -> Optional[List[str]]:
+    def menorCaminho(self, inicio: str, destino: str, bidirecional: bool = False) -> Optional[List[str]]:
         """
         Utiliza BFS para encontrar o menor caminho (em número de arestas) entre dois vértices.
 
         Passos:
-        1. Inserir a estrutura {vertice, caminho} na fila.
-        2. Iniciar a lista de visitados vazia.
-        3. Enquanto a fila não estiver vazia:
-            a. Retirar o primeiro item da fila.
-            b. Verificar se o vértice é o destino.
-                i. Retornar o caminho.
-            c. Marcar vértice como visitado.
-            d. Obter os vizinhos.
-            e. Para cada vizinho:
-                i. Verificar se o vizinho já não foi visitado.
-                ii. Adicionar estrutura com vizinho e caminho atualizado na Fila.
-        4. Retornar vazio se não encontrar.
+        1. Percorrer o grafo em largura a partir de 'inicio', guardando o pai
+           de cada vértice descoberto, até retirar 'destino' da fila.
+        2. Se 'destino' não foi alcançado, retornar vazio.
+        3. Reconstruir o caminho seguindo os pais a partir de 'destino'.
+
+        Com bidirecional=True a busca parte das duas pontas ao mesmo tempo
+        (veja '_menor_caminho_bidirecional'). O comprimento é o mesmo, mas
+        entre caminhos empatados o escolhido pode ser outro.
         """
-        if inicio not in self.vertices or destino not in self.vertices:
+        if inicio not in self.indices or destino not in self.indices:
             return None
-        
-        # a fila armazena a estrutura: {'vertice': 'V', 'caminho': ['A', 'C', 'V']}
-        fila: List[Dict[str, Any]] = [{'vertice': inicio, 'caminho': [inicio]}]
-        visitados: set[str] = {inicio}
+
+        t = self.indices[destino]
+        if bidirecional:
+            caminho = self._menor_caminho_bidirecional(self.indices[inicio], t)
+            if caminho is None:
+                return None
+            return [self.vertices[i] for i in caminho]
+
+        if self._cache is not None:
+            _, pais = self._arvore(self.indices[inicio])
+        else:
+            _, pais = self._percorrer(self.indices[inicio], alvo=t)
+
+        # 2. Retornar vazio se não encontrar
+        if pais[t] is None:
+            return None
+
+        # 3. Reconstruir o caminho
+        return [self.vertices[i] for i in self._caminho(pais, t)]
+
+    def _vizinhos_com_pesos(self, vertice):
+        # Uma varredura da linha por vértice expandido (O(V) no Grafo,
+        # vetorizada no GrafoNumpy e por bits no GrafoBits)
+        pesos = self._pesos.get(vertice, {})
+        for j in self._saidas(self.indices[vertice]):
+            v = self.vertices[j]
+            yield v, pesos.get(v, 1)
+
+    def dijkstra(self, inicio: str, destino: str):
+        """
+        Menor caminho ponderado (algoritmo de Dijkstra com heap, veja
+        Caminhos.dijkstra), parando ao chegar em 'destino'.
+        Retorna (caminho, custo) ou None.
+
+        Cada vértice retirado do heap varre a sua linha da matriz (O(V)),
+        então a busca custa O(V² + E log V) no pior caso, não o
+        O((V+E) log V) das listas.
+        """
+        from .Caminhos import dijkstra
+
+        if inicio not in self.indices or destino not in self.indices:
+            return None
+        return dijkstra(self._vizinhos_com_pesos, inicio, destino)
+
+    def a_estrela(self, inicio: str, destino: str, heuristica):
+        """
+        Menor caminho ponderado com A*: 'heuristica(v)' estima o custo de v
+        até 'destino' (veja Caminhos.a_estrela). Retorna (caminho, custo) ou None.
+        Como em 'dijkstra', custa O(V² + E log V) no pior caso.
+        """
+        from .Caminhos import a_estrela
+
+        if inicio not in self.indices or destino not in self.indices:
+            return None
+        return a_estrela(self._vizinhos_com_pesos, inicio, destino, heuristica)
+
+    def _uniao_busca(self):
+        # Montada na primeira consulta de componentes; daí em diante as
+        # inserções a atualizam e as remoções a descartam (veja _marcar)
+        if self._uniao is None:
+            from .Componentes import uniao_das_arestas
+            self._uniao = uniao_das_arestas(range(len(self.vertices)), self._saidas)
+        return self._uniao
+
+    def mesma_componente(self, a: str, b: str) -> bool:
+        """
+        True se 'a' e 'b' estão no mesmo componente conexo (ignorando a
+        direção das arestas). Usa a união e busca (veja Componentes.UniaoBusca),
+        então cada consulta custa O(α(V)) enquanto só houver inserções.
+        """
+        if a not in self.indices or b not in self.indices:
+            return False
+        return self._uniao_busca().conectados(self.indices[a], self.indices[b])
+
+    def numero_componentes(self) -> int:
+        """
+        Número de componentes conexos (fracamente conexos se direcionado).
+        """
+        return self._uniao_busca().componentes
+
+    def componentes(self) -> List[List[str]]:
+        """
+        Componentes conexos (fracamente conexos se direcionado), cada um
+        com os vértices na ordem de inserção.
+        """
+        return [[self.vertices[i] for i in grupo] for grupo in self._uniao_busca().grupos()]
+
+    def componentes_fortemente_conexas(self) -> List[List[str]]:
+        """
+        Componentes fortemente conexas (Tarjan iterativo, veja
+        Componentes.componentes_fortemente_conexas). No grafo não
+        direcionado são os próprios componentes conexos.
+        """
+        from .Componentes import componentes_fortemente_conexas
+
+        grupos = componentes_fortemente_conexas(range(len(self.vertices)), self._saidas)
+        return [[self.vertices[i] for i in grupo] for grupo in grupos]
+
+    def bfs_multiplas_origens(self, origens, profundidade_maxima: Optional[int] = None, com_pais: bool = False):
+        """
+        BFS a partir de várias origens ao mesmo tempo, nível por nível.
+
+        Passos:
+        1. Colocar todas as origens (que existirem no grafo) na distância 0.
+        2. Enquanto a fronteira não estiver vazia e a profundidade máxima
+           não tiver sido atingida:
+            a. Expandir a fronteira inteira de uma vez ('_expandir_nivel').
+            b. Os vértices novos recebem distância + 1 e formam a próxima fronteira.
+        3. Retornar {vertice: distancia} dos vértices alcançados, nível a
+           nível (a ordem dentro de um nível depende do motor). Com
+           com_pais=True, retornar também {vertice: pai}, com None para as
+           origens.
+
+        Origens que não existem no grafo são ignoradas (não há troca pelo
+        primeiro vértice, como em 'bfs').
+        """
+        visitados = bytearray(len(self.vertices))
+        distancias: Dict[str, int] = {}
+        pais: Dict[str, Optional[str]] = {}
+
+        # 1. Origens na distância 0
+        fronteira = []
+        for origem in origens:
+            i = self.indices.get(origem)
+            if i is None or visitados[i]:
+                continue
+            visitados[i] = 1
+            fronteira.append(i)
+            distancias[origem] = 0
+            pais[origem] = None
+
+        # 2. Expandir nível por nível
+        distancia = 0
+        while fronteira and (profundidade_maxima is None or distancia < profundidade_maxima):
+            distancia += 1
+            proxima = []
+            for j, pai in self._expandir_nivel(fronteira, visitados):
+                v = self.vertices[j]
+                distancias[v] = distancia
+                pais[v] = self.vertices[pai]
+                proxima.append(j)
+            fronteira = proxima
+
+        # 3. Retornar as distâncias (e os pais)
+        if com_pais:
+            return distancias, pais
+        return distancias
+
+    # parâmetros da troca de direção na 'bfs_direcional' (Beamer et al.)
+    ALFA = 14
+    BETA = 24
+
+    def bfs_direcional(self, inicio: str, com_pais: bool = False):
+        """
+        BFS que alterna entre expansão de cima para baixo (a fronteira
+        procura vértices novos pelas saídas) e de baixo para cima (cada
+        vértice não visitado procura um pai na fronteira pelas entradas,
+        parando no primeiro encontrado).
+
+        Passos:
+        1. Começar de cima para baixo a partir de 'inicio'.
+        2. A cada nível:
+            a. m_f = arestas que saem da fronteira; m_u = arestas que saem
+               dos vértices ainda não visitados.
+            b. Se estiver de cima para baixo e m_f > m_u / ALFA, passar para
+               baixo para cima; se estiver de baixo para cima e a fronteira
+               tiver menos de V / BETA vértices, voltar.
+            c. Expandir o nível na direção escolhida.
+        3. Retornar {vertice: distancia} (e {vertice: pai} com com_pais=True),
+           no mesmo formato de 'bfs_multiplas_origens'.
+        """
+        n = len(self.vertices)
+        distancias: Dict[str, int] = {}
+        pais: Dict[str, Optional[str]] = {}
+        s = self.indices.get(inicio)
+        if s is None:
+            return (distancias, pais) if com_pais else distancias
+
+        visitados = bytearray(n)
+        visitados[s] = 1
+        distancias[inicio] = 0
+        pais[inicio] = None
+        fronteira = [s]
+        restantes = sum(self._grau_saida) - self._grau_saida[s]
+        baixo_para_cima = False
+        distancia = 0
+
+        while fronteira:
+            # a. e b. Escolher a direção do nível
+            m_f = sum(self._grau_saida[u] for u in fronteira)
+            if not baixo_para_cima and m_f > restantes / self.ALFA:
+                baixo_para_cima = True
+            elif baixo_para_cima and len(fronteira) < n / self.BETA:
+                baixo_para_cima = False
+
+            # c. Expandir
+            distancia += 1
+            if baixo_para_cima:
+                novos = self._expandir_nivel_por_entradas(fronteira, visitados)
+            else:
+                novos = self._expandir_nivel(fronteira, visitados)
+
+            fronteira = []
+            for j, pai in novos:
+                v = self.vertices[j]
+                distancias[v] = distancia
+                pais[v] = self.vertices[pai]
+                restantes -= self._grau_saida[j]
+                fronteira.append(j)
+
+        return (distancias, pais) if com_pais else distancias
+
+    def _expandir_nivel_por_entradas(self, fronteira: List[int], visitados: bytearray) -> List[Tuple[int, int]]:
+        """
+        Passo de baixo para cima: cada vértice não visitado procura uma
+        entrada vinda da fronteira, parando na primeira. Retorna (novo, pai)
+        como '_expandir_nivel', com o pai de menor índice na fronteira.
+
+        A coluna de cada vértice é lida célula a célula, só nas linhas da
+        fronteira, e a leitura para assim que o pai é encontrado (montar a
+        coluna inteira antes custaria O(V) por vértice, O(V²) por nível).
+        """
+        pais = sorted(fronteira)
+        linhas = [self.matriz[u] for u in pais]
+
+        novos = []
+        for j in range(len(visitados)):
+            if visitados[j]:
+                continue
+            for pai, linha in zip(pais, linhas):
+                if linha[j] == 1:
+                    novos.append((j, pai))
+                    break
+        for j, _ in novos:
+            visitados[j] = 1
+        return novos
+
+    def _expandir_nivel(self, fronteira: List[int], visitados: bytearray) -> List[Tuple[int, int]]:
+        """
+        Expande um nível da BFS: retorna (novo, pai) para cada vértice ainda
+        não visitado que sai da fronteira, marcando-o em 'visitados'. O pai é
+        o primeiro vértice da fronteira (na ordem dada) que chega nele.
+        """
+        novos = []
+        for u in fronteira:
+            for j in self._saidas(u):
+                if not visitados[j]:
+                    visitados[j] = 1
+                    novos.append((j, u))
+        return novos
+
+    def ativar_cache(self, capacidade: int = 1024) -> None:
+        """
+        Liga um cache LRU (veja CacheLRU) de até 'capacidade' itens para
+        'vizinhos' e para as árvores de BFS usadas por 'bfs' e 'menorCaminho'.
+
+        As chaves incluem a versão do grafo, que muda a cada inserção ou
+        remoção; então um resultado antigo nunca é devolvido, e os itens
+        velhos saem pelo próprio limite do LRU.
+        """
+        from .Cache import CacheLRU
+
+        self._cache = CacheLRU(capacidade)
+
+    def desativar_cache(self) -> None:
+        self._cache = None
+
+    def _arvore(self, s: int) -> Tuple[List[int], List[Optional[int]]]:
+        # árvore de BFS completa a partir de 's', do cache se estiver ligado
+        if self._cache is None:
+            return self._percorrer(s)
+        chave = ("arvore", s, self._versao)
+        arvore = self._cache.obter(chave)
+        if arvore is None:
+            arvore = self._percorrer(s)
+            self._cache.guardar(chave, arvore)
+        return arvore
+
+    def _percorrer(self, s: int, alvo: Optional[int] = None) -> Tuple[List[int], List[Optional[int]]]:
+        """
+        Núcleo da BFS sobre índices, usado por 'bfs' e 'menorCaminho'.
+
+        Usa uma deque como fila (retirada O(1)) e um vetor de pais em vez de
+        copiar caminhos, então roda em O(V+E) com memória O(V). Retorna
+        (ordem de visita, pais), onde pais[s] == s e pais[i] is None para
+        vértices não alcançados. Para ao retirar 'alvo' da fila, se informado.
+        """
+        pais: List[Optional[int]] = [None] * len(self.vertices)
+        pais[s] = s
+        ordem = [s]
+        fila = deque(ordem)
 
         while fila:
-            # a. Retirar o primeiro item da fila (FIFO)
-            item_atual = fila.pop(0)
-            vertice_atual = item_atual['vertice']
-            caminho_atual = item_atual['caminho']
-
-            # b. Verificar se o vértice do item retirado é o destino
-            if vertice_atual == destino:
-                # i. Retornar o caminho caso seja
-                return caminho_atual
-            
-            # d. Obter os vizinhos do vértice
-            for vizinho in self.vizinhos(vertice_atual):
-                # i. Verificar se o vizinho já não foi visitado
-                if vizinho not in visitados:
-                    # O BFS garante o menor caminho. Marcar como visitado.
-                    visitados.add(vizinho)
-                    
-                    # ii. Adicionar estrutura com vizinho e caminho atualizado na Fila
-                    novo_caminho = caminho_atual + [vizinho]
-                    fila.append({'vertice': vizinho, 'caminho': novo_caminho})
-
-        # 4. Retornar vazio
+            # a. Retirar o primeiro vértice da fila (FIFO)
+            atual = fila.popleft()
+            if atual == alvo:
+                break
+
+            # vizinhos na mesma ordem de 'vizinhos' (ordenados pelo rótulo)
+            for j in sorted(self._saidas(atual), key=self.vertices.__getitem__):
+                if pais[j] is None:
+                    pais[j] = atual
+                    fila.append(j)
+                    ordem.append(j)
+
+        return ordem, pais
+
+    def _menor_caminho_bidirecional(self, s: int, t: int) -> Optional[List[int]]:
+        """
+        BFS bidirecional: expande, um nível inteiro por vez, o lado com a
+        menor fronteira (para frente pelas saídas, para trás pelas entradas)
+        e para no nível em que as duas buscas se encontram.
+
+        Passos:
+        1. Iniciar a busca para frente em 's' e para trás em 't'.
+        2. Enquanto as duas fronteiras não estiverem vazias:
+            a. Escolher o lado com a menor fronteira.
+            b. Expandir todo o nível, guardando distância e pai de cada novo vértice.
+            c. Se algum novo vértice já foi visto pelo outro lado, escolher o
+               ponto de encontro de menor distância total e montar o caminho.
+        3. Retornar vazio se as fronteiras se esgotarem sem encontro.
+        """
+        if s == t:
+            return [s]
+
+        # distância e pai de cada lado: {indice: (distancia, pai)}
+        frente: Dict[int, Tuple[int, Optional[int]]] = {s: (0, None)}
+        tras: Dict[int, Tuple[int, Optional[int]]] = {t: (0, None)}
+        fronteira_frente, fronteira_tras = [s], [t]
+
+        while fronteira_frente and fronteira_tras:
+            if len(fronteira_frente) <= len(fronteira_tras):
+                vistos, outros, fronteira, expandir = frente, tras, fronteira_frente, self._saidas
+            else:
+                vistos, outros, fronteira, expandir = tras, frente, fronteira_tras, self._predecessores
+
+            proxima = []
+            encontro = None
+            for u in fronteira:
+                distancia = vistos[u][0] + 1
+                for w in expandir(u):
+                    if w in vistos:
+                        continue
+                    vistos[w] = (distancia, u)
+                    proxima.append(w)
+                    if w in outros:
+                        total = distancia + outros[w][0]
+                        if encontro is None or total < encontro[0]:
+                            encontro = (total, w)
+
+            if encontro is not None:
+                meio = encontro[1]
+                caminho = []
+                v = meio
+                while v is not None:
+                    caminho.append(v)
+                    v = frente[v][1]
+                caminho.reverse()
+                v = tras[meio][1]
+                while v is not None:
+                    caminho.append(v)
+                    v = tras[v][1]
+                return caminho
+
+            if vistos is frente:
+                fronteira_frente = proxima
+            else:
+                fronteira_tras = proxima
+
         return None
 
+    @staticmethod
+    def _caminho(pais: List[Optional[int]], t: int) -> List[int]:
+        caminho = [t]
+        while pais[t] != t:
+            t = pais[t]
+            caminho.append(t)
+        caminho.reverse()
+        return caminho
+
+    # Armazenamento da matriz (lista de listas). Motores alternativos
+    # sobrescrevem apenas estes métodos, trabalhando com índices inteiros.
+
+    def _marcar(self, i, j, valor):
+        # Grava a célula e atualiza os contadores de grau se ela mudou
+        if self._obter(i, j) == valor:
+            return
+        self._definir(i, j, valor)
+        delta = 1 if valor else -1
+        self._grau_saida[i] += delta
+        self._grau_entrada[j] += delta
+        # a união e busca só sabe juntar: remover aresta a descarta
+        if self._uniao is not None:
+            if valor:
+                self._uniao.unir(i, j)
+            else:
+                self._uniao = None
+        self._versao += 1
+
+    def _adicionar_indices(self, k):
+        # k novas colunas em cada linha existente e k novas linhas zeradas
+        n = len(self.matriz) + k
+        for linha in self.matriz:
+            linha.extend([0] * k)
+        for _ in range(k):
+            self.matriz.append([0] * n)
+
+    def _remover_indice(self, i):
+        del self.matriz[i]
+        for linha in self.matriz:
+            del linha[i]
+
+    def _obter(self, i, j):
+        return self.matriz[i][j]
+
+    def _existem(self, origens, destinos):
+        # uma célula por par de índices; índice -1 (vértice inexistente) -> False
+        matriz = self.matriz
+        return [i >= 0 and j >= 0 and matriz[i][j] == 1 for i, j in zip(origens, destinos)]
+
+    def _definir(self, i, j, valor):
+        self.matriz[i][j] = valor
+
+    def _linha(self, i):
+        return list(self.matriz[i])
+
+    def _coluna(self, j):
+        return [linha[j] for linha in self.matriz]
+
+    def _saidas(self, i):
+        # índices j (em ordem crescente) com matriz[i][j] == 1
+        return [j for j, conexao in enumerate(self.matriz[i]) if conexao == 1]
+
+    def _predecessores(self, j):
+        # índices i (em ordem crescente) com matriz[i][j] == 1
+        if not self.direcionado:
+            return self._saidas(j)
+        return [i for i, linha in enumerate(self.matriz) if linha[j] == 1]
+
+
+class GrafoNumpy(Grafo):
+    """
+    Mesma interface de 'Grafo', com a matriz guardada em um único array
+    NumPy contíguo de uint8 (1 byte por célula).
+
+    A capacidade cresce geometricamente (dobra quando enche), então
+    inserir_vertice custa O(1) amortizado em vez de O(V), e vizinhos usa
+    np.flatnonzero sobre a linha.
+    """
+
+    __slots__ = ("_n", "_dados")
+
+    CAPACIDADE_INICIAL = 16
+
+    def __init__(self, direcionado: bool, capacidade: int = CAPACIDADE_INICIAL) -> None:
+        _importar_numpy()
+        super().__init__(direcionado)
+        self._n = 0
+        self._dados = np.zeros((max(1, capacidade),) * 2, dtype=np.uint8)
+
+    def __setstate__(self, estado):
+        # pickle/deepcopy não passam pelo __init__: garantir o numpy carregado
+        _importar_numpy()
+        _, atributos = estado
+        for nome, valor in atributos.items():
+            setattr(self, nome, valor)
+
+    @property
+    def matriz(self):
+        # visão (sem cópia) da parte ocupada do array
+        return self._dados[:self._n, :self._n]
+
+    @matriz.setter
+    def matriz(self, valor):
+        # 'Grafo.__init__' atribui uma lista vazia; o array é criado aqui
+        pass
+
+    def _adicionar_indices(self, k):
+        capacidade = self._dados.shape[0]
+        n = self._n + k
+        if n > capacidade:
+            nova = capacidade
+            while nova < n:
+                nova *= 2
+            novo = np.zeros((nova, nova), dtype=np.uint8)
+            novo[:capacidade, :capacidade] = self._dados
+            self._dados = novo
+        self._n = n
+
+    def _remover_indice(self, i):
+        n = self._n
+        d = self._dados
+        # desloca linhas e colunas seguintes uma posição para trás
+        d[i:n - 1, :n] = d[i + 1:n, :n]
+        d[:n - 1, i:n - 1] = d[:n - 1, i + 1:n]
+        d[n - 1, :n] = 0
+        d[:n, n - 1] = 0
+        self._n = n - 1
+
+    def _copiar_matriz(self, novo):
+        novo._n = self._n
+        novo._dados = self._dados.copy()
+
+    def _obter(self, i, j):
+        return int(self._dados[i, j])
+
+    def _existem(self, origens, destinos):
+        # indexação vetorizada: todas as células lidas em uma única operação
+        linhas = np.asarray(origens, dtype=np.intp)
+        colunas = np.asarray(destinos, dtype=np.intp)
+        validos = (linhas >= 0) & (colunas >= 0)
+        existe = np.zeros(len(linhas), dtype=bool)
+        existe[validos] = self._dados[linhas[validos], colunas[validos]] == 1
+        return existe.tolist()
+
+    def _definir(self, i, j, valor):
+        self._dados[i, j] = valor
+
+    def _linha(self, i):
+        return self._dados[i, :self._n].tolist()
+
+    def _coluna(self, j):
+        return self._dados[:self._n, j].tolist()
+
+    def _saidas(self, i):
+        return np.flatnonzero(self._dados[i, :self._n]).tolist()
+
+    def _predecessores(self, j):
+        if not self.direcionado:
+            return self._saidas(j)
+        return np.flatnonzero(self._dados[:self._n, j]).tolist()
+
+    def _expandir_nivel(self, fronteira: List[int], visitados: bytearray) -> List[Tuple[int, int]]:
+        # Todas as linhas da fronteira de uma vez: OR das linhas filtrado
+        # pelos não visitados, e o pai é a primeira linha com 1 na coluna.
+        linhas = np.asarray(fronteira)
+        sub = self._dados[linhas, :self._n]
+        marcados = np.frombuffer(visitados, dtype=np.uint8)
+        novos = np.flatnonzero(sub.any(axis=0) & (marcados == 0))
+        if not len(novos):
+            return []
+        pais = linhas[sub[:, novos].argmax(axis=0)]
+        marcados[novos] = 1
+        return list(zip(novos.tolist(), pais.tolist()))
+
+    def _expandir_nivel_por_entradas(self, fronteira: List[int], visitados: bytearray) -> List[Tuple[int, int]]:
+        # Colunas dos não visitados contra as linhas da fronteira (em ordem
+        # crescente) de uma vez; o pai é a primeira linha com 1 na coluna.
+        # As linhas são selecionadas antes das colunas: a indexação em duas
+        # etapas é bem mais rápida que a de pares (linhas[:, None], colunas).
+        linhas = np.sort(np.asarray(fronteira))
+        marcados = np.frombuffer(visitados, dtype=np.uint8)
+        restantes = np.flatnonzero(marcados == 0)
+        if not len(restantes):
+            return []
+        sub = self._dados[linhas, :self._n][:, restantes]
+        encontrados = sub.any(axis=0)
+        novos = restantes[encontrados]
+        if not len(novos):
+            return []
+        pais = linhas[sub[:, encontrados].argmax(axis=0)]
+        marcados[novos] = 1
+        return list(zip(novos.tolist(), pais.tolist()))
+
+
+class GrafoBits(Grafo):
+    """
+    Mesma interface de 'Grafo' (não ponderado), com cada linha da matriz
+    compactada em um inteiro Python: o bit j da linha i indica a aresta i -> j.
+
+    Ocupa 1 bit por célula (64x menos que a lista de listas) e permite que
+    bfs/menorCaminho expandam uma linha inteira com operações bit a bit
+    contra o conjunto de visitados, sem percorrer célula por célula.
+    """
+
+    __slots__ = ("_linhas",)
+
+    def __init__(self, direcionado: bool) -> None:
+        super().__init__(direcionado)
+        self._linhas: List[int] = []
+
+    @property
+    def matriz(self):
+        return [self._linha(i) for i in range(len(self._linhas))]
+
+    @matriz.setter
+    def matriz(self, valor):
+        pass
+
+    def _adicionar_indices(self, k):
+        self._linhas.extend([0] * k)
+
+    def _remover_indice(self, i):
+        del self._linhas[i]
+        baixo = (1 << i) - 1
+        for k, linha in enumerate(self._linhas):
+            # junta os bits abaixo de i com os de cima deslocados uma posição
+            self._linhas[k] = (linha & baixo) | ((linha >> (i + 1)) << i)
+
+    def _copiar_matriz(self, novo):
+        # inteiros são imutáveis: copiar a lista basta
+        novo._linhas = list(self._linhas)
+
+    def _obter(self, i, j):
+        return (self._linhas[i] >> j) & 1
+
+    def _existem(self, origens, destinos):
+        linhas = self._linhas
+        return [i >= 0 and j >= 0 and (linhas[i] >> j) & 1 == 1 for i, j in zip(origens, destinos)]
+
+    def _definir(self, i, j, valor):
+        if valor:
+            self._linhas[i] |= 1 << j
+        else:
+            self._linhas[i] &= ~(1 << j)
+
+    def _linha(self, i):
+        linha = self._linhas[i]
+        return [(linha >> j) & 1 for j in range(len(self._linhas))]
+
+    def _coluna(self, j):
+        return [(linha >> j) & 1 for linha in self._linhas]
+
+    def _saidas(self, i):
+        return self._bits(self._linhas[i])
+
+    def _predecessores(self, j):
+        if not self.direcionado:
+            return self._saidas(j)
+        return [i for i, linha in enumerate(self._linhas) if (linha >> j) & 1]
+
+    @staticmethod
+    def _bits(conjunto: int) -> List[int]:
+        # índices dos bits ligados, em ordem crescente
+        indices = []
+        while conjunto:
+            menor = conjunto & -conjunto
+            indices.append(menor.bit_length() - 1)
+            conjunto ^= menor
+        return indices
+
+    def _expandir_nivel(self, fronteira: List[int], visitados: bytearray) -> List[Tuple[int, int]]:
+        # 'alcancados' junta as linhas já vistas neste nível, então cada
+        # vértice é decodificado no máximo uma vez por nível
+        alcancados = 0
+        novos = []
+        for u in fronteira:
+            bits = self._linhas[u] & ~alcancados
+            if not bits:
+                continue
+            alcancados |= bits
+            for j in self._bits(bits):
+                if not visitados[j]:
+                    visitados[j] = 1
+                    novos.append((j, u))
+        return novos
+
+    def _expandir_nivel_por_entradas(self, fronteira: List[int], visitados: bytearray) -> List[Tuple[int, int]]:
+        # Sem direção, a coluna de j é a própria linha j: um AND com o
+        # conjunto da fronteira e o menor bit ligado é o pai. Com direção,
+        # só os j alcançados por alguma linha da fronteira têm pai, e ele é
+        # a primeira dessas linhas (em ordem crescente) com o bit j ligado.
+        linhas = self._linhas
+        novos = []
+        if not self.direcionado:
+            conjunto = 0
+            for u in fronteira:
+                conjunto |= 1 << u
+            for j in range(len(visitados)):
+                if not visitados[j]:
+                    comum = linhas[j] & conjunto
+                    if comum:
+                        novos.append((j, (comum & -comum).bit_length() - 1))
+        else:
+            pais = sorted(fronteira)
+            alcancados = 0
+            for u in pais:
+                alcancados |= linhas[u]
+            for j in self._bits(alcancados):
+                if visitados[j]:
+                    continue
+                for pai in pais:
+                    if (linhas[pai] >> j) & 1:
+                        novos.append((j, pai))
+                        break
+        for j, _ in novos:
+            visitados[j] = 1
+        return novos
+
+    def _novos_ordenados(self, novos: int) -> List[int]:
+        # mesma ordem de 'vizinhos' (ordenada pelo rótulo)
+        return sorted(self._bits(novos), key=self.vertices.__getitem__)
+
+    def _percorrer(self, s: int, alvo: Optional[int] = None) -> Tuple[List[int], List[Optional[int]]]:
+        """
+        Mesmo contrato de 'Grafo._percorrer', com o conjunto de visitados em
+        um inteiro: os vizinhos ainda não visitados de cada vértice saem de
+        uma única operação linha & ~visitados.
+        """
+        pais: List[Optional[int]] = [None] * len(self._linhas)
+        pais[s] = s
+        visitados = 1 << s
+        ordem = [s]
+        k = 0
+        while k < len(ordem):
+            atual = ordem[k]
+            k += 1
+            if atual == alvo:
+                break
+
+            novos = self._linhas[atual] & ~visitados
+            if novos:
+                visitados |= novos
+                for j in self._novos_ordenados(novos):
+                    pais[j] = atual
+                    ordem.append(j)
+
+        return ordem, pais
+
+
+def criar_grafo():
+    """
+    Retorna o grafo da Atividade 1 (não direcionado).
+    """
+    g = Grafo(direcionado=False)
+
+    # Inserção de arestas (V1--V2, V1--V6, V2--V3, V2--V4, V2--V6, V2--V7, V4--V5, V5--V6, V5--V8, V6--V7, V7--V8)
+    arestas = [
+        ("V1", "V2"), ("V1", "V6"),
+        ("V2", "V3"), ("V2", "V4"), ("V2", "V7"),
+        ("V4", "V5"),
+        ("V5", "V8"),
+        ("V6", "V7")
+    ]
 
-# Criação do grafo da Atividade 1 (não direcionado)
-g = Grafo(direcionado=False)
+    # inserindo mais arestas
+    g.inserir_aresta("V2", "V6")
+    g.inserir_aresta("V5", "V6")
+    g.inserir_aresta("V7", "V8")
 
-# Inserção de arestas (V1--V2, V1--V6, V2--V3, V2--V4, V2--V6, V2--V7, V4--V5, V5--V6, V5--V8, V6--V7, V7--V8)
-arestas = [
-    ("V1", "V2"), ("V1", "V6"),
-    ("V2", "V3"), ("V2", "V4"), ("V2", "V7"),
-    ("V4", "V5"),
-    ("V5", "V8"),
-    ("V6", "V7")
-]
+    g.inserir_arestas_em_lote(arestas)
+    return g
 
- # inserindo mais arestas
-g.inserir_aresta("V2", "V6")
-g.inserir_aresta("V5", "V6")
-g.inserir_aresta("V7", "V8")
 
+def main():
+    """
+    Demonstração da Atividade 1: BFS a partir de V1 e menores caminhos.
+    (Roda só quando o módulo é executado, não ao ser importado.)
+    """
+    g = criar_grafo()
 
-for u, v in arestas:
-    g.inserir_aresta(u, v)
+    print("--- Exercicio 1 ---".upper())
+    ordem_visitados = g.bfs("V1")
+    print(f"Ordem de visita BFS (a partir de V1): {ordem_visitados}")
 
-print("--- Exercicio 1 ---".upper())
-ordem_visitados = g.bfs("V1")
-print(f"Ordem de visita BFS (a partir de V1): {ordem_visitados}")
+    print("\n--- exercicio 2  --".upper())
 
-print("\n--- exercicio 2  --".upper())
+    inicio = "V1"
+    destino = "V8"
+    caminho = g.menorCaminho(inicio, destino)
+    print(f"Menor caminho de {inicio} para {destino}: {caminho}")
 
-inicio = "V1"
-destino = "V8"
-caminho = g.menorCaminho(inicio, destino)
-print(f"Menor caminho de {inicio} para {destino}: {caminho}")
+    inicio = "V3"
+    destino = "V5"
+    caminho = g.menorCaminho(inicio, destino)
+    print(f"Menor caminho de {inicio} para {destino}: {caminho}")
 
-inicio = "V3"
-destino = "V5"
-caminho = g.menorCaminho(inicio, destino)
-print(f"Menor caminho de {inicio} para {destino}: {caminho}")
 
+if __name__ == "__main__":
+    main()
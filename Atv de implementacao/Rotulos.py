@@ -0,0 +1,75 @@
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional
+
+
+class TabelaRotulos:
+    """
+    Tabela de rótulos: associa cada rótulo externo (nome do vértice) a um
+    índice inteiro denso 0..V-1, e guarda uma única cópia de cada rótulo.
+
+    As estruturas internas trabalham com os índices (ou com o objeto
+    canônico de 'rotulos'), e a tradução para os rótulos só acontece na
+    interface pública. Assim, rótulos iguais vindos de lugares diferentes
+    (ex.: cada linha de um arquivo) não viram várias strings na memória.
+    """
+
+    __slots__ = ("rotulos", "indices")
+
+    def __init__(self, rotulos: Iterable[Hashable] = ()) -> None:
+        self.rotulos: List[Hashable] = []
+        self.indices: Dict[Hashable, int] = {}
+        for rotulo in rotulos:
+            self.indice(rotulo)
+
+    def indice(self, rotulo: Hashable) -> int:
+        """
+        Retorna o índice de 'rotulo', registrando-o no fim da tabela se for novo.
+        """
+        i = self.indices.get(rotulo)
+        if i is None:
+            i = self.indices[rotulo] = len(self.rotulos)
+            self.rotulos.append(rotulo)
+        return i
+
+    def procurar(self, rotulo: Hashable) -> Optional[int]:
+        """
+        Retorna o índice de 'rotulo', ou None se ele não estiver na tabela.
+        """
+        return self.indices.get(rotulo)
+
+    def canonico(self, rotulo: Hashable) -> Hashable:
+        """
+        Retorna o objeto guardado na tabela para 'rotulo' (registrando-o se for novo).
+        """
+        return self.rotulos[self.indice(rotulo)]
+
+    def remover(self, rotulo: Hashable) -> Optional[int]:
+        """
+        Remove 'rotulo' e retorna o índice que ele tinha (ou None). Os
+        rótulos seguintes descem uma posição, mantendo os índices densos.
+        """
+        i = self.indices.pop(rotulo, None)
+        if i is None:
+            return None
+        del self.rotulos[i]
+        for k in range(i, len(self.rotulos)):
+            self.indices[self.rotulos[k]] = k
+        return i
+
+    def __copy__(self) -> "TabelaRotulos":
+        # tabela independente com os mesmos rótulos (os objetos são compartilhados)
+        nova = TabelaRotulos.__new__(TabelaRotulos)
+        nova.rotulos = list(self.rotulos)
+        nova.indices = dict(self.indices)
+        return nova
+
+    def __getitem__(self, i: int) -> Hashable:
+        return self.rotulos[i]
+
+    def __contains__(self, rotulo: Hashable) -> bool:
+        return rotulo in self.indices
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.rotulos)
+
+    def __len__(self) -> int:
+        return len(self.rotulos)
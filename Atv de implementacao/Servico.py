@@ -0,0 +1,224 @@
+import asyncio
+import json
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from .ConsultasParalelas import _caminhos_da_origem
+
+# operações aceitas -> número de argumentos
+OPERACOES = {"menorCaminho": 2, "vizinhos": 1, "existe_aresta": 2}
+
+# (operação, argumentos, futuro que recebe a resposta)
+Pedido = Tuple[str, tuple, asyncio.Future]
+
+
+class ServicoConsultas:
+    """
+    Serviço asyncio de consultas a um grafo (menorCaminho, vizinhos e
+    existe_aresta), usado direto no processo ou por um socket local
+    (veja 'servir').
+
+    Os pedidos que chegam dentro de uma janela de 'janela' segundos viram
+    um único lote, resolvido fora do laço de eventos em 'executor' (por
+    padrão, uma thread própria; com uma só thread, os lotes não disputam o
+    grafo). Em um lote, os menores caminhos de uma mesma origem saem de uma
+    única árvore de BFS.
+
+    O grafo não deve ser alterado enquanto o serviço estiver em uso. Grafos
+    sem BFS por índices (GrafoListaAdj, GrafoListaArestas) são congelados
+    (veja 'congelar') ao criar o serviço.
+    """
+
+    def __init__(self, grafo, janela: float = 0.001, tamanho_maximo: int = 1024, executor: Optional[Executor] = None) -> None:
+        if not hasattr(grafo, "_percorrer"):
+            grafo = grafo.congelar()
+        self.grafo = grafo
+        self.janela = janela
+        self.tamanho_maximo = tamanho_maximo
+        self._executor = executor if executor is not None else ThreadPoolExecutor(1, thread_name_prefix="consultas")
+        self._proprio_executor = executor is None
+        self._pendentes: List[Pedido] = []
+        self._agendado: Optional[asyncio.TimerHandle] = None
+        self._tarefas = set()
+        # contadores: lotes despachados e consultas respondidas
+        self.lotes = 0
+        self.consultas = 0
+
+    # Interface no processo
+
+    async def menor_caminho(self, inicio, destino) -> Optional[List]:
+        return await self.consultar("menorCaminho", inicio, destino)
+
+    async def vizinhos(self, vertice) -> List:
+        return await self.consultar("vizinhos", vertice)
+
+    async def existe_aresta(self, origem, destino) -> bool:
+        return await self.consultar("existe_aresta", origem, destino)
+
+    async def consultar(self, operacao: str, *args) -> Any:
+        """
+        Enfileira uma consulta no lote atual e espera a resposta.
+
+        Passos:
+        1. Validar a operação, o número de argumentos e se eles servem de
+           rótulo (precisam ser hasháveis): um pedido inválido falha sozinho,
+           sem entrar no lote dos outros.
+        2. Guardar o pedido com um futuro para a resposta.
+        3. Se for o primeiro pedido da janela, agendar o despacho para daqui
+           a 'janela' segundos; se o lote encheu, despachar já.
+        """
+        # 1. Validar
+        if OPERACOES.get(operacao) != len(args):
+            raise ValueError(f"consulta inválida: {operacao}/{len(args)}")
+        for arg in args:
+            try:
+                hash(arg)
+            except TypeError:
+                raise TypeError(f"rótulo de vértice inválido: {arg!r}") from None
+
+        # 2. Guardar o pedido
+        loop = asyncio.get_running_loop()
+        futuro = loop.create_future()
+        self._pendentes.append((operacao, args, futuro))
+
+        # 3. Agendar ou despachar
+        if len(self._pendentes) >= self.tamanho_maximo:
+            self._despachar()
+        elif self._agendado is None:
+            self._agendado = loop.call_later(self.janela, self._despachar)
+        return await futuro
+
+    def _despachar(self) -> None:
+        # Fecha o lote atual e o manda para o executor
+        if self._agendado is not None:
+            self._agendado.cancel()
+            self._agendado = None
+        lote, self._pendentes = self._pendentes, []
+        if lote:
+            tarefa = asyncio.ensure_future(self._executar(lote))
+            self._tarefas.add(tarefa)
+            tarefa.add_done_callback(self._tarefas.discard)
+
+    async def _executar(self, lote: List[Pedido]) -> None:
+        consultas = [(operacao, args) for operacao, args, _ in lote]
+        try:
+            respostas = await asyncio.get_running_loop().run_in_executor(self._executor, self._resolver, consultas)
+        except Exception as erro:  # executor fechado, por exemplo
+            respostas = [erro] * len(lote)
+
+        self.lotes += 1
+        self.consultas += len(lote)
+        for (_, _, futuro), resposta in zip(lote, respostas):
+            if futuro.done():  # quem pediu desistiu (cancelado)
+                continue
+            if isinstance(resposta, Exception):
+                futuro.set_exception(resposta)
+            else:
+                futuro.set_result(resposta)
+
+    def _resolver(self, consultas: List[Tuple[str, tuple]]) -> List[Any]:
+        """
+        Resolve um lote inteiro (roda no executor, fora do laço de eventos).
+
+        Passos:
+        1. Agrupar os menores caminhos por origem e resolver cada grupo com
+           uma única BFS.
+        2. Responder as demais consultas direto no grafo.
+        3. Devolver as respostas na ordem dos pedidos (uma exceção no lugar
+           da resposta de uma consulta que falhou).
+        """
+        grafo = self.grafo
+        respostas: List[Any] = [None] * len(consultas)
+
+        # 1. Menores caminhos por origem
+        grupos: Dict[Any, List[int]] = {}
+        for k, (operacao, args) in enumerate(consultas):
+            if operacao == "menorCaminho":
+                grupos.setdefault(args[0], []).append(k)
+        for origem, posicoes in grupos.items():
+            destinos = [consultas[k][1][1] for k in posicoes]
+            try:
+                caminhos = _caminhos_da_origem(grafo, origem, destinos)
+            except Exception as erro:
+                caminhos = [(None, erro)] * len(posicoes)
+            for k, (_, caminho) in zip(posicoes, caminhos):
+                respostas[k] = caminho
+
+        # 2. Demais consultas
+        for k, (operacao, args) in enumerate(consultas):
+            if operacao == "menorCaminho":
+                continue
+            try:
+                respostas[k] = getattr(grafo, operacao)(*args)
+            except Exception as erro:
+                respostas[k] = erro
+
+        # 3. Na ordem dos pedidos
+        return respostas
+
+    async def fechar(self) -> None:
+        """
+        Despacha o que estiver pendente, espera os lotes em andamento e
+        encerra o executor próprio.
+        """
+        self._despachar()
+        if self._tarefas:
+            await asyncio.gather(*self._tarefas, return_exceptions=True)
+        if self._proprio_executor:
+            self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "ServicoConsultas":
+        return self
+
+    async def __aexit__(self, *excecao) -> None:
+        await self.fechar()
+
+    # Interface por socket: uma mensagem JSON por linha, nos dois sentidos.
+    # Pedido:   {"id": 1, "op": "menorCaminho", "args": ["V1", "V8"]}
+    # Resposta: {"id": 1, "resultado": [...]} ou {"id": 1, "erro": "..."}
+    # As respostas saem quando ficam prontas (não necessariamente em ordem).
+
+    async def servir(self, host: str = "127.0.0.1", porta: int = 0) -> asyncio.AbstractServer:
+        """
+        Abre um servidor TCP em (host, porta) e o retorna; porta=0 escolhe
+        uma porta livre (veja server.sockets[0].getsockname()).
+        """
+        return await asyncio.start_server(self._atender, host, porta)
+
+    async def _atender(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        trava = asyncio.Lock()
+        pendentes = set()
+
+        async def responder(pedido: Any) -> None:
+            resposta: Dict[str, Any] = {"id": None}
+            try:
+                # JSON válido mas fora do formato (ex.: [1, 2]) vira resposta de erro
+                if not isinstance(pedido, dict):
+                    raise ValueError("o pedido deve ser um objeto JSON")
+                resposta["id"] = pedido.get("id")
+                args = pedido.get("args", [])
+                if not isinstance(args, list):
+                    raise ValueError("'args' deve ser uma lista")
+                resposta["resultado"] = await self.consultar(pedido.get("op"), *args)
+            except Exception as erro:
+                resposta["erro"] = f"{type(erro).__name__}: {erro}"
+            async with trava:
+                escritor.write(json.dumps(resposta, ensure_ascii=False).encode("utf-8") + b"\n")
+                await escritor.drain()
+
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha:
+                    break
+                try:
+                    pedido = json.loads(linha)
+                except ValueError:
+                    pedido = {"op": None}
+                tarefa = asyncio.ensure_future(responder(pedido))
+                pendentes.add(tarefa)
+                tarefa.add_done_callback(pendentes.discard)
+            if pendentes:
+                await asyncio.gather(*pendentes, return_exceptions=True)
+        finally:
+            escritor.close()
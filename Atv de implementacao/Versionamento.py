@@ -0,0 +1,86 @@
+import copy
+import threading
+from contextlib import contextmanager
+
+
+class GrafoVersionado:
+    """
+    Grafo para várias threads, com cópia na escrita (copy-on-write).
+
+    Cada versão publicada é um grafo comum (Grafo, GrafoNumpy, GrafoBits,
+    GrafoListaAdj ou GrafoListaArestas) que ninguém mais altera. As leituras
+    usam a versão atual sem trava nenhuma; as escritas, uma de cada vez,
+    alteram uma cópia e a publicam trocando uma única referência, então uma
+    leitura vê a versão antiga inteira ou a nova inteira, nunca um meio-termo.
+
+    Uso:
+        versionado = GrafoVersionado(grafo)
+        retrato = versionado.retrato()        # leitor: versão fixa
+        retrato.bfs("A"); retrato.menorCaminho("A", "B")
+        with versionado.alterar() as novo:    # escritor: várias mudanças,
+            novo.inserir_aresta("A", "C")     # uma única cópia e publicação
+            novo.remover_vertice("B")
+
+    As cópias usam o __copy__ de cada classe, que copia só as estruturas
+    do grafo (linhas da matriz, dicionários de vizinhos); um copy.deepcopy
+    visitaria cada célula e cada rótulo.
+
+    Métodos inserir_*/remover_* chamados direto no GrafoVersionado são uma
+    escrita cada (uma cópia por chamada); os demais leem a versão atual.
+    """
+
+    __slots__ = ("_atual", "_trava", "versao")
+
+    def __init__(self, grafo) -> None:
+        self._trava = threading.Lock()
+        self.versao = 0
+        # copiado para que quem passou 'grafo' não altere a versão publicada
+        self._publicar(copy.copy(grafo))
+
+    def retrato(self):
+        """
+        Retorna a versão atual. Ela não muda depois de publicada: um leitor
+        que faz várias consultas nela vê sempre o mesmo grafo. Não deve ser
+        alterada (use 'alterar').
+        """
+        return self._atual
+
+    @contextmanager
+    def alterar(self):
+        """
+        Abre uma escrita: fornece uma cópia da versão atual para ser alterada
+        e a publica ao sair do bloco sem erro (com erro, nada é publicado).
+
+        Passos:
+        1. Pegar a trava de escrita (escritores entram um de cada vez; os
+           leitores não esperam).
+        2. Copiar a versão atual (copy.copy: veja o __copy__ de cada classe).
+        3. Entregar a cópia ao bloco 'with'.
+        4. Publicar a cópia como a nova versão.
+        """
+        # 1. Um escritor por vez
+        with self._trava:
+            # 2. e 3. Cópia para o bloco
+            novo = copy.copy(self._atual)
+            yield novo
+
+            # 4. Publicar
+            self._publicar(novo)
+
+    def _publicar(self, grafo) -> None:
+        # O cache LRU (Grafo.ativar_cache) se altera a cada leitura e não é
+        # seguro entre threads, então as versões publicadas ficam sem ele
+        if getattr(grafo, "_cache", None) is not None:
+            grafo.desativar_cache()
+        # a troca de uma referência é atômica: os leitores veem uma versão ou a outra
+        self._atual = grafo
+        self.versao += 1
+
+    def __getattr__(self, nome):
+        # Chamado só para nomes que não são do GrafoVersionado
+        if nome.startswith(("inserir_", "remover_")):
+            def escrever(*args, **kwargs):
+                with self.alterar() as novo:
+                    return getattr(novo, nome)(*args, **kwargs)
+            return escrever
+        return getattr(self._atual, nome)
@@ -0,0 +1,55 @@
+"""
+Grafos da disciplina como um pacote importável (instalado como 'grafos').
+
+Os módulos se importam entre si por importações relativas (ex.:
+'from .Rotulos import TabelaRotulos'). Nada é carregado aqui: cada
+classe/função exportada é importada do seu módulo no primeiro acesso (ex.:
+'grafos.GrafoListaAdj' não carrega a matriz, e o numpy só entra com
+'grafos.GrafoNumpy').
+"""
+import importlib
+
+# nome exportado -> módulo que o define
+_EXPORTACOES = {
+    "Grafo": "MatrizAdjacencia",
+    "GrafoNumpy": "MatrizAdjacencia",
+    "GrafoBits": "MatrizAdjacencia",
+    "GrafoListaAdj": "ListaDeAdjacencia",
+    "GrafoListaArestas": "listaDeArestas",
+    "GrafoCSR": "FormatoCSR",
+    "TabelaRotulos": "Rotulos",
+    "UniaoBusca": "Componentes",
+    "CacheLRU": "Cache",
+    "carregar": "ArquivoArestas",
+    "menores_caminhos_em_lote": "ConsultasParalelas",
+    "instrumentar": "Instrumentacao",
+    "desinstrumentar": "Instrumentacao",
+    "ServicoConsultas": "Servico",
+    "GrafoVersionado": "Versionamento",
+}
+
+_MODULOS = {
+    "MatrizAdjacencia", "ListaDeAdjacencia", "listaDeArestas", "FormatoCSR",
+    "Rotulos", "Componentes", "Cache", "Caminhos", "ArquivoArestas",
+    "ConsultasParalelas", "Instrumentacao", "Servico", "Versionamento", "benchmark",
+}
+
+__all__ = sorted(_EXPORTACOES)
+
+
+def __getattr__(nome):
+    # Chamado só para nomes que ainda não estão no pacote: importa o
+    # módulo, guarda o resultado e os próximos acessos não passam por aqui
+    if nome in _EXPORTACOES:
+        valor = getattr(importlib.import_module("." + _EXPORTACOES[nome], __name__), nome)
+    elif nome in _MODULOS:
+        valor = importlib.import_module("." + nome, __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _MODULOS)
+
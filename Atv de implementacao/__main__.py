@@ -0,0 +1,45 @@
+import argparse
+import importlib
+import sys
+
+if __name__ == "__main__" and not __package__:
+    # Rodado como pasta/arquivo ('python "Atv de implementacao"'): os
+    # módulos só são importáveis pelo pacote, então roda como 'grafos'
+    import _direto
+    _direto.rodar(__file__)
+
+# comando -> módulo cuja função main() ele roda
+DEMONSTRACOES = {
+    "matriz": "MatrizAdjacencia",
+    "lista-adj": "ListaDeAdjacencia",
+    "lista-arestas": "listaDeArestas",
+}
+
+
+def main(argv=None):
+    """
+    Ponto de entrada de linha de comando ('grafos' ou 'python -m grafos').
+
+    grafos [matriz | lista-adj | lista-arestas]   roda a demonstração do módulo
+    grafos benchmark [opções]                      roda benchmark.main
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == "benchmark":
+        # as opções seguem direto para o argparse do benchmark
+        return _modulo("benchmark").main(argv[1:])
+
+    parser = argparse.ArgumentParser(prog="grafos", description="Demonstrações das representações de grafo.",
+                                     epilog="\"grafos benchmark --help\" mostra as opções do benchmark.")
+    parser.add_argument("demonstracao", nargs="?", choices=list(DEMONSTRACOES), default="matriz")
+    args = parser.parse_args(argv)
+    return _modulo(DEMONSTRACOES[args.demonstracao]).main()
+
+
+def _modulo(nome):
+    # Os módulos usam importações relativas, então são importados como
+    # submódulos do pacote ('grafos.MatrizAdjacencia')
+    return importlib.import_module("." + nome, __package__)
+
+
+if __name__ == "__main__":
+    main()
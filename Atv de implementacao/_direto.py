@@ -0,0 +1,42 @@
+"""
+Execução direta dos módulos como arquivos ('python MatrizAdjacencia.py').
+
+Os módulos se importam por importações relativas, que só funcionam dentro
+do pacote. Rodado como arquivo, o módulo chama 'rodar(__file__)' antes
+dessas importações: a pasta é carregada como o pacote 'grafos' (sem
+precisar de 'pip install') e o módulo roda de dentro dele, como em
+'python -m grafos.MatrizAdjacencia'.
+"""
+import importlib.util
+import os
+import runpy
+import sys
+
+
+def rodar(arquivo: str) -> None:
+    """
+    Roda 'arquivo' como módulo do pacote 'grafos' e encerra o processo.
+
+    Passos:
+    1. Carregar a pasta do arquivo como o pacote 'grafos' (se ele ainda não
+       foi carregado a partir dela).
+    2. Rodar o módulo como 'grafos.<nome>' com __name__ == "__main__".
+    3. Encerrar: o restante do arquivo, rodado fora do pacote, não pode
+       continuar.
+    """
+    # 1. Carregar a pasta como o pacote
+    pasta = os.path.dirname(os.path.abspath(arquivo))
+    pacote = sys.modules.get("grafos")
+    if pacote is None or os.path.dirname(os.path.abspath(getattr(pacote, "__file__", "") or "")) != pasta:
+        spec = importlib.util.spec_from_file_location(
+            "grafos", os.path.join(pasta, "__init__.py"), submodule_search_locations=[pasta])
+        pacote = importlib.util.module_from_spec(spec)
+        sys.modules["grafos"] = pacote
+        spec.loader.exec_module(pacote)
+
+    # 2. Rodar como submódulo
+    nome = os.path.splitext(os.path.basename(arquivo))[0]
+    runpy.run_module("grafos." + nome, run_name="__main__", alter_sys=True)
+
+    # 3. Encerrar
+    raise SystemExit(0)
@@ -0,0 +1,300 @@
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+if __name__ == "__main__" and not __package__:
+    # Rodado como arquivo ('python benchmark.py'): as importações relativas
+    # abaixo só funcionam no pacote, então roda como 'grafos.benchmark'
+    import _direto
+    _direto.rodar(__file__)
+
+from .MatrizAdjacencia import Grafo, GrafoBits, GrafoNumpy
+from .ListaDeAdjacencia import GrafoListaAdj
+from .listaDeArestas import GrafoListaArestas
+
+Aresta = Tuple[str, str]
+
+# Grafos sintéticos (não direcionados, rótulos "0".."n-1")
+
+
+def erdos_renyi(n: int, grau_medio: float, rng: random.Random) -> List[Aresta]:
+    """
+    Grafo aleatório G(n, m) de Erdős–Rényi com m = n * grau_medio / 2
+    arestas sorteadas uniformemente, sem laços nem repetidas.
+    """
+    m = min(int(n * grau_medio / 2), n * (n - 1) // 2)
+    pares = set()
+    while len(pares) < m:
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a != b:
+            pares.add((a, b) if a < b else (b, a))
+    return [(str(a), str(b)) for a, b in sorted(pares)]
+
+
+def barabasi_albert(n: int, grau_medio: float, rng: random.Random) -> List[Aresta]:
+    """
+    Grafo de Barabási–Albert (ligação preferencial): cada vértice novo se
+    liga a k = grau_medio / 2 vértices já existentes, sorteados com
+    probabilidade proporcional ao grau.
+
+    Passos:
+    1. Começar com os k primeiros vértices como alvos.
+    2. Para cada vértice novo v:
+        - Ligar v a cada alvo.
+        - Colocar os alvos e v (k vezes) na lista de sorteio, de forma que
+          cada vértice apareça nela tantas vezes quanto seu grau.
+        - Sortear k alvos distintos para o próximo vértice.
+    """
+    k = max(1, min(int(grau_medio // 2), n - 1))
+    arestas = []
+    sorteio: List[int] = []
+    # 1. Alvos iniciais
+    alvos = list(range(k))
+    # 2. Vértices novos
+    for v in range(k, n):
+        for alvo in alvos:
+            arestas.append((str(v), str(alvo)))
+        sorteio.extend(alvos)
+        sorteio.extend([v] * k)
+        escolhidos = set()
+        while len(escolhidos) < k:
+            escolhidos.add(rng.choice(sorteio))
+        alvos = list(escolhidos)
+    return arestas
+
+
+def grade(n: int, grau_medio: float = 4, rng: random.Random = None) -> List[Aresta]:
+    """
+    Grade quadrada com lado floor(sqrt(n)), cada célula ligada à da direita
+    e à de baixo (grau 4 no interior; 'grau_medio' e 'rng' são ignorados).
+    """
+    lado = math.isqrt(n)
+    arestas = []
+    for linha in range(lado):
+        for coluna in range(lado):
+            v = linha * lado + coluna
+            if coluna + 1 < lado:
+                arestas.append((str(v), str(v + 1)))
+            if linha + 1 < lado:
+                arestas.append((str(v), str(v + lado)))
+    return arestas
+
+
+GERADORES: Dict[str, Callable[..., List[Aresta]]] = {
+    "erdos_renyi": erdos_renyi,
+    "barabasi_albert": barabasi_albert,
+    "grade": grade,
+}
+
+# Representações: criar(), inserir(grafo, origem, destino), e se guarda
+# uma matriz V x V (limitada por --max-matriz)
+CLASSES = {
+    "Grafo": (lambda: Grafo(False), lambda g, a, b: g.inserir_aresta(a, b), True),
+    "GrafoNumpy": (lambda: GrafoNumpy(False), lambda g, a, b: g.inserir_aresta(a, b), True),
+    "GrafoBits": (lambda: GrafoBits(False), lambda g, a, b: g.inserir_aresta(a, b), True),
+    "GrafoListaAdj": (GrafoListaAdj, lambda g, a, b: g.inserir_aresta(a, b, nao_direcionado=True), False),
+    "GrafoListaArestas": (GrafoListaArestas, lambda g, a, b: g.inserir_aresta(a, b, nao_direcionado=True), False),
+}
+CLASSES_PADRAO = ["Grafo", "GrafoListaAdj", "GrafoListaArestas"]
+
+
+def _construir(classe: str, vertices: List[str], arestas: List[Aresta]):
+    criar, inserir, _ = CLASSES[classe]
+    g = criar()
+    for v in vertices:
+        g.inserir_vertice(v)
+    for a, b in arestas:
+        inserir(g, a, b)
+    return g
+
+
+def _medir(funcao: Callable[[], object], repeticoes: int) -> float:
+    # Melhor tempo (em segundos) entre as repetições
+    melhor = math.inf
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def _resultado(segundos: float, operacoes: int, **extra) -> dict:
+    return {
+        "segundos": segundos,
+        "operacoes": operacoes,
+        "us_por_operacao": 1e6 * segundos / operacoes if operacoes else None,
+        **extra,
+    }
+
+
+def medir_classe(classe: str, vertices: List[str], arestas: List[Aresta], consultas: int, repeticoes: int, rng: random.Random) -> dict:
+    """
+    Mede uma representação em um grafo já gerado.
+
+    Passos:
+    1. Memória: construir o grafo com o tracemalloc ligado e guardar o pico
+       e o que ficou alocado (o tracemalloc deixa o código mais lento, então
+       os tempos vêm de uma segunda construção).
+    2. inserir_aresta: construir de novo, medindo só as inserções.
+    3. Consultas de leitura sobre 'consultas' entradas sorteadas:
+       existe_aresta (metade arestas existentes, metade pares ao acaso),
+       vizinhos, grau_vertices, bfs e menorCaminho. As classes de lista não
+       têm bfs/menorCaminho; para elas, mede-se congelar() e a busca na
+       cópia CSR, marcado com "via": "congelar".
+    4. remover_vertice por último, porque altera o grafo.
+    """
+    resultado: Dict[str, dict] = {}
+
+    # 1. Memória
+    tracemalloc.start()
+    g = _construir(classe, vertices, arestas)
+    atual, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del g
+    resultado["memoria"] = {"bytes_atual": atual, "bytes_pico": pico}
+
+    # 2. Inserção
+    criar, inserir, _ = CLASSES[classe]
+    g = criar()
+    for v in vertices:
+        g.inserir_vertice(v)
+    inicio = time.perf_counter()
+    for a, b in arestas:
+        inserir(g, a, b)
+    resultado["inserir_aresta"] = _resultado(time.perf_counter() - inicio, len(arestas))
+
+    # 3. Consultas
+    metade = consultas // 2
+    pares = [rng.choice(arestas) for _ in range(metade)] if arestas else []
+    pares += [(rng.choice(vertices), rng.choice(vertices)) for _ in range(consultas - len(pares))]
+    amostra = [rng.choice(vertices) for _ in range(consultas)]
+    origens = amostra[: max(1, consultas // 100)]
+    destinos = [rng.choice(vertices) for _ in origens]
+
+    segundos = _medir(lambda: [g.existe_aresta(a, b) for a, b in pares], repeticoes)
+    resultado["existe_aresta"] = _resultado(segundos, len(pares))
+
+    segundos = _medir(lambda: [g.vizinhos(v) for v in amostra], repeticoes)
+    resultado["vizinhos"] = _resultado(segundos, len(amostra))
+
+    segundos = _medir(g.grau_vertices, repeticoes)
+    resultado["grau_vertices"] = _resultado(segundos, 1)
+
+    extra = {}
+    busca = g
+    if not hasattr(g, "bfs"):
+        inicio = time.perf_counter()
+        busca = g.congelar()
+        resultado["congelar"] = _resultado(time.perf_counter() - inicio, 1)
+        extra = {"via": "congelar"}
+
+    segundos = _medir(lambda: [busca.bfs(v) for v in origens], repeticoes)
+    resultado["bfs"] = _resultado(segundos, len(origens), **extra)
+
+    segundos = _medir(lambda: [busca.menorCaminho(a, b) for a, b in zip(origens, destinos)], repeticoes)
+    resultado["menorCaminho"] = _resultado(segundos, len(origens), **extra)
+
+    # 4. Remoção
+    removidos = rng.sample(vertices, min(len(vertices), max(1, consultas // 100)))
+    inicio = time.perf_counter()
+    for v in removidos:
+        g.remover_vertice(v)
+    resultado["remover_vertice"] = _resultado(time.perf_counter() - inicio, len(removidos))
+
+    return resultado
+
+
+def _versao_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy.__version__
+
+
+def executar(tamanhos: List[int], geradores: List[str], classes: List[str], grau_medio: float = 8,
+             consultas: int = 1000, repeticoes: int = 3, semente: int = 42, max_matriz: int = 2000,
+             progresso=None) -> dict:
+    """
+    Roda o benchmark para cada combinação (gerador, tamanho, classe) e
+    retorna o relatório (pronto para json.dump).
+
+    A mesma semente gera os mesmos grafos e consultas em toda execução.
+    Classes de matriz com mais de 'max_matriz' vértices são puladas (a
+    matriz V x V não caberia na memória).
+    """
+    relatorio = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementacao": platform.python_implementation(),
+            "plataforma": platform.platform(),
+            "numpy": _versao_numpy(),
+            "data": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "semente": semente,
+            "grau_medio": grau_medio,
+            "consultas": consultas,
+            "repeticoes": repeticoes,
+        },
+        "resultados": [],
+    }
+
+    for nome_gerador in geradores:
+        for n in tamanhos:
+            arestas = GERADORES[nome_gerador](n, grau_medio, random.Random(semente))
+            vertices = sorted({v for aresta in arestas for v in aresta}, key=int)
+            for classe in classes:
+                registro = {
+                    "gerador": nome_gerador,
+                    "classe": classe,
+                    "vertices": len(vertices),
+                    "arestas": len(arestas),
+                }
+                if not arestas:
+                    registro["pulado"] = "grafo sem arestas"
+                elif CLASSES[classe][2] and len(vertices) > max_matriz:
+                    registro["pulado"] = f"matriz com mais de {max_matriz} vértices"
+                else:
+                    if progresso:
+                        progresso(f"{nome_gerador} n={len(vertices)} {classe}")
+                    rng = random.Random(semente)
+                    registro["operacoes"] = medir_classe(classe, vertices, arestas, consultas, repeticoes, rng)
+                relatorio["resultados"].append(registro)
+
+    return relatorio
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark das representações de grafo.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="números de vértices (ex.: 1000 10000 100000 1000000)")
+    parser.add_argument("--geradores", nargs="+", choices=sorted(GERADORES), default=sorted(GERADORES))
+    parser.add_argument("--classes", nargs="+", choices=list(CLASSES), default=CLASSES_PADRAO)
+    parser.add_argument("--grau-medio", type=float, default=8)
+    parser.add_argument("--consultas", type=int, default=1000)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--max-matriz", type=int, default=2000,
+                        help="maior número de vértices para as classes de matriz")
+    parser.add_argument("--saida", help="arquivo JSON (padrão: saída padrão)")
+    args = parser.parse_args(argv)
+
+    relatorio = executar(args.tamanhos, args.geradores, args.classes, args.grau_medio, args.consultas,
+                         args.repeticoes, args.semente, args.max_matriz,
+                         progresso=lambda texto: print(texto, file=sys.stderr))
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+    else:
+        json.dump(relatorio, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+
+
+if __name__ == "__main__":
+    main()
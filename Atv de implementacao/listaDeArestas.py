@@ -1,4 +1,17 @@
+import copy
+
+if __name__ == "__main__" and not __package__:
+    # Rodado como arquivo ('python listaDeArestas.py'): as importações relativas
+    # abaixo só funcionam no pacote, então roda como 'grafos.listaDeArestas'
+    import _direto
+    _direto.rodar(__file__)
+
+from .Rotulos import TabelaRotulos
+
+
 class GrafoListaArestas:
+    __slots__ = ("vertices", "_rotulos", "_arestas", "_incidencias", "_graus", "_uniao")
+
     def __init__(self):
         """
         Cria e retorna uma estrutura de grafo com lista de arestas e lista de vértices.
@@ -7,9 +20,29 @@ class GrafoListaArestas:
         1. Criar uma lista vazia chamada 'vertices'.
         2. Criar uma lista vazia chamada 'arestas', onde cada elemento será uma lista de tamanho 2 (origem, destino)
         3. Retornar vertices e arestas
+
+        As arestas ficam em um dicionário {aresta: peso} (pertinência O(1),
+        mantendo a ordem de inserção para 'arestas'), e
+        cada vértice tem um índice com as arestas que o tocam, atualizado a
+        cada inserção e remoção.
+        """
+        # 'vertices' é a lista da tabela de rótulos: cada rótulo é guardado uma
+        # vez e as arestas apontam para esse mesmo objeto
+        self._rotulos = TabelaRotulos()
+        self.vertices = self._rotulos.rotulos
+        self._arestas = {}
+        self._incidencias = {}
+        # grau de cada vértice (laços contam duas vezes), mantido a cada inserção/remoção
+        self._graus = {}
+        # união e busca dos componentes (montada só quando consultada)
+        self._uniao = None
+
+    @property
+    def arestas(self):
+        """
+        Lista de arestas (origem, destino) na ordem em que foram inseridas.
         """
-        self.vertices = []
-        self.arestas = []
+        return list(self._arestas)
 
     def inserir_vertice(self, vertice):
         """
@@ -19,10 +52,14 @@ class GrafoListaArestas:
         1. Verificar se o vértice já existe em 'vertices'.
         2. Se não existir, adicionar à lista 'vertices'.
         """
-        if vertice not in self.vertices:
-            self.vertices.append(vertice)
-
-    def inserir_aresta(self, origem, destino, nao_direcionado=False):
+        if vertice not in self._incidencias:
+            vertice = self._rotulos.canonico(vertice)
+            if self._uniao is not None:
+                self._uniao.adicionar(vertice)
+            self._incidencias[vertice] = {}
+            self._graus[vertice] = 0
+
+    def inserir_aresta(self, origem, destino, nao_direcionado=False, peso=1):
         """
         Adiciona uma aresta entre dois vértices.
 
@@ -31,16 +68,90 @@ class GrafoListaArestas:
             - Se não existirem, chamar 'inserir_vertice' para adicioná-los.
         2. Adicionar uma lista [origem, destino] na lista 'arestas'.
         3. Se nao_direcionado=True, adicionar também [destino, origem].
+        4. Guardar o peso da aresta (se ela já existir, só o peso é atualizado).
         """
+        if peso < 0:
+            raise ValueError("o peso da aresta não pode ser negativo")
+
         # 1. Garantir que 'origem' e 'destino' existam em 'vertices'.
         self.inserir_vertice(origem)
         self.inserir_vertice(destino)
+        origem = self._rotulos.canonico(origem)
+        destino = self._rotulos.canonico(destino)
         
         v1, v2 = sorted((origem, destino)) if nao_direcionado else (origem, destino)
         
-        if (v1, v2) not in self.arestas:
-            self.arestas.append((v1, v2))
+        aresta = (v1, v2)
+        if aresta not in self._arestas:
+            self._incidencias[v1][aresta] = None
+            self._incidencias[v2][aresta] = None
+            self._graus[v1] += 1
+            self._graus[v2] += 1
+            if self._uniao is not None:
+                self._uniao.unir(v1, v2)
+        self._arestas[aresta] = peso
+
+
+    def inserir_arestas_em_lote(self, arestas, nao_direcionado=False):
+        """
+        Adiciona várias arestas (pares origem, destino) de uma vez.
+
+        Passos:
+        1. Para cada par, registrar origem e destino em 'vertices' se forem novos.
+        2. Normalizar a aresta como em 'inserir_aresta' (ordenada se nao_direcionado=True).
+        3. Adicionar a aresta (peso 1) se ainda não existir, atualizando índices e graus.
+        """
+        tabela = self._rotulos
+        conjunto = self._arestas
+        incidencias = self._incidencias
+        graus = self._graus
+        uniao = self._uniao
+        for origem, destino in arestas:
+            # 1. Registrar os vértices novos (usando o rótulo canônico da tabela)
+            origem = tabela.canonico(origem)
+            destino = tabela.canonico(destino)
+            for v in (origem, destino):
+                if v not in incidencias:
+                    incidencias[v] = {}
+                    graus[v] = 0
+
+            # 2. Normalizar a aresta
+            aresta = tuple(sorted((origem, destino))) if nao_direcionado else (origem, destino)
+
+            # 3. Adicionar se for nova
+            if aresta not in conjunto:
+                conjunto[aresta] = 1
+                v1, v2 = aresta
+                incidencias[v1][aresta] = None
+                incidencias[v2][aresta] = None
+                graus[v1] += 1
+                graus[v2] += 1
+                if uniao is not None:
+                    uniao.unir(v1, v2)
+
+    @classmethod
+    def de_arestas(cls, arestas, nao_direcionado=False):
+        """
+        Cria um grafo já com as arestas informadas (veja 'inserir_arestas_em_lote').
+        """
+        g = cls()
+        g.inserir_arestas_em_lote(arestas, nao_direcionado)
+        return g
 
+    def __copy__(self):
+        """
+        Retorna uma cópia independente do grafo (alterar uma não muda a
+        outra): dicionários novos de arestas, incidências e graus, com os
+        mesmos rótulos. Bem mais barato que copy.deepcopy.
+        """
+        novo = object.__new__(type(self))
+        novo._rotulos = copy.copy(self._rotulos)
+        novo.vertices = novo._rotulos.rotulos
+        novo._arestas = dict(self._arestas)
+        novo._incidencias = {v: dict(arestas) for v, arestas in self._incidencias.items()}
+        novo._graus = dict(self._graus)
+        novo._uniao = copy.copy(self._uniao)
+        return novo
 
     def remover_aresta(self, origem, destino, nao_direcionado=False):
         """
@@ -51,13 +162,23 @@ class GrafoListaArestas:
         2. Se encontrar, remover
         3. Se nao_direcionado=True, também procurar por [destino, origem]
         """
-        if (origem, destino) in self.arestas:
-            self.arestas.remove((origem, destino))
+        if (origem, destino) in self._arestas:
+            self._remover((origem, destino))
             return
         
-        if (destino, origem) in self.arestas:
-            self.arestas.remove((destino, origem))
+        if (destino, origem) in self._arestas:
+            self._remover((destino, origem))
             return
+
+    def _remover(self, aresta):
+        # Remove a aresta do conjunto e dos índices das duas pontas
+        del self._arestas[aresta]
+        u, v = aresta
+        del self._incidencias[u][aresta]
+        self._incidencias[v].pop(aresta, None)
+        self._graus[u] -= 1
+        self._graus[v] -= 1
+        self._uniao = None
             
 
     def remover_vertice(self, vertice):
@@ -71,14 +192,18 @@ class GrafoListaArestas:
             como origem ou destino.
         """
         # 1. Verificar se o vértice existe na lista de vertices.
-        if vertice not in self.vertices:
+        if vertice not in self._incidencias:
             return
 
         # 2. Caso encontrado, remover o vértice da lista 'vertices'.
-        self.vertices.remove(vertice)
+        self._rotulos.remover(vertice)
         
-        # 3. Percorrer a lista de 'arestas' e remover todas onde o vértice aparece
-        self.arestas = [a for a in self.arestas if vertice not in a]
+        # 3. Remover todas as arestas onde o vértice aparece (pelo índice do vértice)
+        for aresta in list(self._incidencias[vertice]):
+            self._remover(aresta)
+        del self._incidencias[vertice]
+        del self._graus[vertice]
+        self._uniao = None
 
 
     def existe_aresta(self, origem, destino):
@@ -86,12 +211,12 @@ class GrafoListaArestas:
         Verifica se existe uma aresta entre origem e destino.
 
         Passos:
-        1. Percorrer a lista de aresta procurando [origem, destino]
-        2. Retornar True se encontrar
-        3. Caso não encontre na lista, retornar False no final.
+        1. Procurar (origem, destino) no conjunto de arestas
+        2. Procurar também (destino, origem)
+        3. Retornar True se alguma das duas existir, caso contrário False.
         """
 
-        return (origem, destino) in self.arestas or (destino, origem) in self.arestas
+        return (origem, destino) in self._arestas or (destino, origem) in self._arestas
 
 
     def vizinhos(self, vertice):
@@ -104,14 +229,14 @@ class GrafoListaArestas:
         3. Se origem == vertice, adicionar destino na lista de vizinhos.
         4. Retornar a lista final.
         """
-        if vertice not in self.vertices:
+        if vertice not in self._incidencias:
             return []
 
         # 1. Criar uma lista vazia chamada 'vizinhos'.
         vizinhos_list = []
         
-        # 2. Percorrer todas as arestas [origem, destino].
-        for u, v in self.arestas:
+        # 2. Percorrer as arestas [origem, destino] que tocam o vértice.
+        for u, v in self._incidencias[vertice]:
             # 3. Se origem == vertice, adicionar destino na lista de vizinhos (e vice-versa para não direcionado).
             if u == vertice:
                 vizinhos_list.append(v)
@@ -122,6 +247,44 @@ class GrafoListaArestas:
         return vizinhos_list
 
 
+    def peso_aresta(self, origem, destino):
+        """
+        Retorna o peso da aresta entre origem e destino (em qualquer
+        sentido, como 'existe_aresta'), ou None se ela não existir.
+        """
+        peso = self._arestas.get((origem, destino))
+        if peso is None:
+            peso = self._arestas.get((destino, origem))
+        return peso
+
+    def _vizinhos_com_pesos(self, vertice):
+        for u, v in self._incidencias[vertice]:
+            yield (v if u == vertice else u), self._arestas[(u, v)]
+
+    def dijkstra(self, inicio, destino):
+        """
+        Menor caminho ponderado (algoritmo de Dijkstra com heap, veja
+        Caminhos.dijkstra), parando ao chegar em 'destino'.
+        Retorna (caminho, custo) ou None.
+        """
+        from .Caminhos import dijkstra
+
+        if inicio not in self._incidencias or destino not in self._incidencias:
+            return None
+        return dijkstra(self._vizinhos_com_pesos, inicio, destino)
+
+    def a_estrela(self, inicio, destino, heuristica):
+        """
+        Menor caminho ponderado com A*: 'heuristica(v)' estima o custo de v
+        até 'destino' (veja Caminhos.a_estrela). Retorna (caminho, custo) ou None.
+        """
+        from .Caminhos import a_estrela
+
+        if inicio not in self._incidencias or destino not in self._incidencias:
+            return None
+        return a_estrela(self._vizinhos_com_pesos, inicio, destino, heuristica)
+
+
     def grau_vertices(self):
         """
         Calcula o grau de entrada, saída e total de cada vértice.
@@ -136,21 +299,15 @@ class GrafoListaArestas:
                 - Se o vértice for destino incrementar grau de entrada do vértice destino.
                 - Calcular o grau total (entrada + saída).
         4. Retornar o dicionário 'graus' para cada vértice.
-        """
-        graus = {v: {"entrada": 0, "saida": 0, "total": 0} for v in self.vertices}
-        
-        for u, v in self.arestas:
 
-            if u in graus:
-                graus[u]["total"] += 1
-            if v in graus:
-                graus[v]["total"] += 1
+        A contagem do passo 2 é mantida em '_graus' por inserir_aresta e pelas
+        remoções, então aqui só é lida (O(V) para a tabela inteira).
+        """
+        graus = {}
 
         for v in self.vertices:
-            grau = graus[v]["total"]
-
-            graus[v]["entrada"] = grau
-            graus[v]["saida"] = grau
+            grau = self._graus[v]
+            graus[v] = {"entrada": grau, "saida": grau, "total": grau}
             
         return graus
 
@@ -190,7 +347,7 @@ class GrafoListaArestas:
         vizinhos_list = self.vizinhos(vertice)
         
         # 2. Exibir a lista formatada.
-        if vertice in self.vertices:
+        if vertice in self._incidencias:
             print(f"Vizinhos de '{vertice}': {vizinhos_list}")
         else:
             print(f"O vértice '{vertice}' não existe.")
@@ -215,10 +372,93 @@ class GrafoListaArestas:
         
         # 2. Exibir todas as arestas no formato (origem -> destino).
         print("Lista de Arestas:")
-        for u, v in self.arestas:
+        for u, v in self._arestas:
             print(f"{u} -- {v}")
 
 
+    def existe_arestas(self, pares):
+        """
+        Versão em lote de 'existe_aresta' (nos dois sentidos, como ela): duas
+        consultas de hash por par. Retorna um booleano por par (origem, destino).
+        """
+        arestas = self._arestas
+        return [(origem, destino) in arestas or (destino, origem) in arestas for origem, destino in pares]
+
+    def percursos_validos(self, caminhos):
+        """
+        Versão em lote de 'percurso_valido': um booleano por caminho. A
+        verificação de um caminho para no primeiro passo que não existe.
+        """
+        arestas = self._arestas
+        return [all((origem, destino) in arestas or (destino, origem) in arestas
+                    for origem, destino in zip(caminho, caminho[1:]))
+                for caminho in caminhos]
+
+    def _uniao_busca(self):
+        # Montada na primeira consulta de componentes; daí em diante as
+        # inserções a atualizam e as remoções a descartam
+        if self._uniao is None:
+            from .Componentes import uniao_das_arestas
+            self._uniao = uniao_das_arestas(self.vertices, self.vizinhos)
+        return self._uniao
+
+    def mesma_componente(self, a, b):
+        """
+        True se 'a' e 'b' estão no mesmo componente conexo (ignorando a
+        direção das arestas). Usa a união e busca (veja Componentes.UniaoBusca),
+        então cada consulta custa O(α(V)) enquanto só houver inserções.
+        """
+        return self._uniao_busca().conectados(a, b)
+
+    def numero_componentes(self):
+        """
+        Número de componentes conexos (ignorando a direção das arestas).
+        """
+        return self._uniao_busca().componentes
+
+    def componentes(self):
+        """
+        Componentes conexos (ignorando a direção das arestas), cada um com
+        os vértices na ordem de inserção.
+        """
+        return self._uniao_busca().grupos()
+
+    def componentes_fortemente_conexas(self):
+        """
+        Componentes fortemente conexas (Tarjan iterativo, veja
+        Componentes.componentes_fortemente_conexas). Como 'vizinhos' percorre cada aresta nos
+        dois sentidos, elas coincidem com os componentes conexos.
+        """
+        from .Componentes import componentes_fortemente_conexas
+
+        return componentes_fortemente_conexas(self.vertices, self.vizinhos)
+
+    def congelar(self):
+        """
+        Retorna uma cópia imutável do grafo no formato CSR (veja GrafoCSR),
+        para consultas de leitura.
+
+        Passos:
+        1. Numerar os vértices na ordem de 'vertices'.
+        2. Para cada aresta (u, v), colocar v na linha de u e u na linha de v
+           (mesma regra de 'vizinhos').
+        """
+        from .FormatoCSR import GrafoCSR
+
+        # 1. Numerar os vértices na ordem de 'vertices'.
+        indices = {v: i for i, v in enumerate(self.vertices)}
+
+        # 2. Montar as linhas a partir das arestas.
+        linhas = [[] for _ in self.vertices]
+        for u, v in self._arestas:
+            i, j = indices[u], indices[v]
+            linhas[i].append(j)
+            if i != j:
+                linhas[j].append(i)
+
+        return GrafoCSR.de_listas(self.vertices, linhas, direcionado=False)
+
+
 def criar_grafo():
     """
     Cria e retorna uma estrutura de grafo com lista de arestas e lista de vértices.
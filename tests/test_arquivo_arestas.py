@@ -0,0 +1,31 @@
+import pytest
+
+from grafos.ArquivoArestas import escrever_binario, ler_arestas, ler_binario
+
+
+def test_ler_arestas_linha_sem_destino(tmp_path):
+    caminho = tmp_path / "arestas.txt"
+    caminho.write_text("# comentário\na b\n\nc\n", encoding="utf-8")
+    leitura = ler_arestas(str(caminho))
+    assert next(leitura) == ("a", "b")
+    with pytest.raises(ValueError, match=r"arestas\.txt:4"):
+        next(leitura)
+
+
+def test_escrever_e_ler_binario(tmp_path):
+    # blocos menores que o arquivo forçam a leitura em partes
+    arestas = [(f"v{k % 7}", f"v{(k * 3) % 11}") for k in range(25)] + [("á", "b c")]
+    caminho = str(tmp_path / "arestas.bin")
+    assert escrever_binario(caminho, arestas, tamanho_bloco=4) == len(arestas)
+    assert list(ler_binario(caminho, tamanho_bloco=4)) == arestas
+
+
+def test_binario_vazio_e_invalido(tmp_path):
+    vazio = str(tmp_path / "vazio.bin")
+    assert escrever_binario(vazio, []) == 0
+    assert list(ler_binario(vazio)) == []
+
+    invalido = tmp_path / "invalido.bin"
+    invalido.write_bytes(b"nao e um arquivo de arestas")
+    with pytest.raises(ValueError):
+        list(ler_binario(str(invalido)))
@@ -0,0 +1,63 @@
+import math
+import random
+
+from grafos import Grafo, GrafoBits, GrafoListaAdj, GrafoListaArestas, GrafoNumpy
+
+MOTORES = (lambda: Grafo(True), lambda: GrafoNumpy(True), lambda: GrafoBits(True),
+           GrafoListaAdj, GrafoListaArestas)
+
+
+def _arestas(n, m, semente):
+    # arestas direcionadas distintas, sem laços, com pesos de 1 a 9
+    rng = random.Random(semente)
+    pares = {}
+    while len(pares) < m:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            pares.setdefault((f"v{u}", f"v{v}"), rng.randint(1, 9))
+    return pares
+
+
+def _bellman_ford(vertices, pares, inicio):
+    custos = dict.fromkeys(vertices, math.inf)
+    custos[inicio] = 0
+    for _ in range(len(vertices) - 1):
+        for (u, v), peso in pares.items():
+            if custos[u] + peso < custos[v]:
+                custos[v] = custos[u] + peso
+    return custos
+
+
+def _nos_dois_sentidos(pares):
+    # a lista de arestas percorre cada aresta nos dois sentidos (veja 'vizinhos')
+    referencia = dict(pares)
+    for (u, v), peso in pares.items():
+        referencia[v, u] = min(peso, referencia.get((v, u), math.inf))
+    return referencia
+
+
+def test_dijkstra_e_a_estrela_iguais_a_bellman_ford():
+    vertices = [f"v{k}" for k in range(30)]
+    for semente in range(3):
+        pares = _arestas(30, 70, semente)
+        for criar in MOTORES:
+            g = criar()
+            for v in vertices:
+                g.inserir_vertice(v)
+            for (u, v), peso in pares.items():
+                g.inserir_aresta(u, v, peso=peso)
+            referencia = _nos_dois_sentidos(pares) if isinstance(g, GrafoListaArestas) else pares
+
+            custos = {v: _bellman_ford(vertices, referencia, v) for v in vertices}
+            for inicio in ("v0", "v5"):
+                for destino in vertices:
+                    # heurística admissível: metade do custo real até 'destino'
+                    heuristica = lambda v: custos[v][destino] / 2
+                    for resultado in (g.dijkstra(inicio, destino), g.a_estrela(inicio, destino, heuristica)):
+                        if custos[inicio][destino] == math.inf:
+                            assert resultado is None
+                            continue
+                        caminho, custo = resultado
+                        assert caminho[0] == inicio and caminho[-1] == destino
+                        assert custo == custos[inicio][destino]
+                        assert sum(referencia[u, v] for u, v in zip(caminho, caminho[1:])) == custo
@@ -0,0 +1,79 @@
+import random
+
+from grafos import Grafo, GrafoBits, GrafoListaAdj, GrafoListaArestas, GrafoNumpy
+
+
+def test_lista_adj_remover_aresta_no_sentido_inverso():
+    # a aresta existe só como B -> A; removê-la pelo lado não direcionado
+    # precisa invalidar a união e busca já montada
+    g = GrafoListaAdj()
+    g.inserir_aresta("B", "A")
+    assert g.numero_componentes() == 1
+    g.remover_aresta("A", "B", nao_direcionado=True)
+    assert g.numero_componentes() == 2
+    assert not g.mesma_componente("A", "B")
+
+
+def test_remover_aresta_separa_componentes():
+    for criar in (lambda: Grafo(False), lambda: GrafoNumpy(False), lambda: GrafoBits(False),
+                  GrafoListaAdj, GrafoListaArestas):
+        g = criar()
+        g.inserir_aresta("A", "B")
+        g.inserir_aresta("C", "D")
+        assert g.numero_componentes() == 2
+        g.inserir_aresta("B", "C")
+        assert g.mesma_componente("A", "D")
+        g.remover_aresta("B", "C")
+        if isinstance(g, GrafoListaAdj):
+            # inserir_aresta da lista é direcionado: sobra C -> B
+            g.remover_aresta("C", "B")
+        assert g.numero_componentes() == 2
+        assert not g.mesma_componente("A", "D")
+
+
+def _alcancaveis(g, inicio):
+    vistos = {inicio}
+    pilha = [inicio]
+    while pilha:
+        for v in g.vizinhos(pilha.pop()):
+            if v not in vistos:
+                vistos.add(v)
+                pilha.append(v)
+    return vistos
+
+
+def test_componentes_fortemente_conexas_iguais_a_alcancabilidade():
+    rng = random.Random(7)
+    vertices = [f"v{k}" for k in range(40)]
+    arestas = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(55)]
+    for criar in (lambda: Grafo(True), lambda: GrafoNumpy(True), lambda: GrafoBits(True),
+                  GrafoListaAdj, GrafoListaArestas):
+        g = criar()
+        for v in vertices:
+            g.inserir_vertice(v)
+        for u, v in arestas:
+            g.inserir_aresta(u, v)
+
+        # u e v ficam juntos se, e só se, um alcança o outro
+        alcance = {v: _alcancaveis(g, v) for v in vertices}
+        grupos = g.componentes_fortemente_conexas()
+        indice = {v: k for k, grupo in enumerate(grupos) for v in grupo}
+        assert sorted(indice) == sorted(vertices) and sum(map(len, grupos)) == len(vertices)
+        for u in vertices:
+            for v in vertices:
+                assert (indice[u] == indice[v]) == (v in alcance[u] and u in alcance[v])
+
+        # ordem topológica reversa: uma aresta entre componentes aponta para um anterior
+        for u in vertices:
+            for v in g.vizinhos(u):
+                assert indice[v] <= indice[u]
+
+
+def test_componentes_fortemente_conexas_em_ciclo_longo():
+    # sem recursão: um ciclo maior que o limite de recursão do Python
+    g = GrafoListaAdj()
+    n = 5000
+    for k in range(n):
+        g.inserir_aresta(k, (k + 1) % n)
+    g.inserir_aresta(0, "fora")
+    assert sorted(map(len, g.componentes_fortemente_conexas())) == [1, n]
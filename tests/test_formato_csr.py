@@ -0,0 +1,51 @@
+import pickle
+
+from grafos import GrafoCSR, GrafoListaAdj
+
+
+def _direcionado():
+    g = GrafoListaAdj()
+    for origem, destino in [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d"), ("d", "e"), ("e", "a"), ("f", "e")]:
+        g.inserir_aresta(origem, destino)
+    return g
+
+
+def test_salvar_e_abrir_grafo_vazio(tmp_path):
+    caminho = str(tmp_path / "vazio.csr")
+    GrafoCSR.de_listas([], []).salvar(caminho)
+    with GrafoCSR.abrir(caminho) as g:
+        assert g.vertices == [] and len(g.destinos) == 0
+        assert g.bfs() == []
+        assert g.vizinhos("a") == [] and not g.existe_aresta("a", "b")
+
+
+def test_salvar_e_abrir_grafo_direcionado(tmp_path):
+    original = _direcionado()
+    csr = original.congelar()
+    caminho = str(tmp_path / "direcionado.csr")
+    csr.salvar(caminho)
+
+    with GrafoCSR.abrir(caminho) as g:
+        assert g.direcionado
+        assert g.vertices == csr.vertices
+        for v in g.vertices:
+            assert g.vizinhos(v) == original.vizinhos(v)
+        assert g.existe_aresta("e", "a") and not g.existe_aresta("a", "e")
+        assert g.menorCaminho("a", "e") == csr.menorCaminho("a", "e")
+        assert g.menorCaminho("a", "f") is None
+        assert g.grau_vertices() == csr.grau_vertices()
+
+
+def test_grafo_mapeado_em_pickle_e_fechar(tmp_path):
+    caminho = str(tmp_path / "mapeado.csr")
+    _direcionado().congelar().salvar(caminho)
+
+    g = GrafoCSR.abrir(caminho)
+    copia = pickle.loads(pickle.dumps(g))
+    g.fechar()
+    g.fechar()  # fechar de novo não faz nada
+
+    # a cópia não depende do mapeamento do arquivo
+    assert copia.direcionado and copia.vertices == g.vertices
+    assert copia.vizinhos("a") == ["b", "c"]
+    assert copia.menorCaminho("f", "d") == ["f", "e", "a", "b", "d"]
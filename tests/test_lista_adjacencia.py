@@ -0,0 +1,49 @@
+from grafos import GrafoListaAdj
+
+
+def test_remover_vertices_mantem_ordem_e_arestas():
+    # remover mais da metade dos vértices força a renumeração dos ids
+    g = GrafoListaAdj()
+    for k in range(9):
+        g.inserir_aresta(f"v{k}", f"v{k + 1}", nao_direcionado=True, peso=k + 1)
+    for k in (1, 2, 4, 5, 7, 8):
+        g.remover_vertice(f"v{k}")
+    g.inserir_aresta("v0", "v1")
+
+    assert list(g.grafo) == ["v0", "v3", "v6", "v9", "v1"]
+    assert g.vizinhos("v0") == ["v1"]
+    assert g.vizinhos("v3") == [] and g.vizinhos("v2") == []
+    assert g.existe_aresta("v0", "v1") and not g.existe_aresta("v1", "v0")
+    assert g.peso_aresta("v0", "v1") == 1
+    assert g.grau_vertices()["v1"] == {"entrada": 1, "saida": 0, "total": 1}
+    assert g.numero_componentes() == 4
+    assert g.congelar().vizinhos("v0") == ["v1"]
+
+
+def test_pesos_seguem_os_vertices_apos_remocao():
+    g = GrafoListaAdj()
+    g.inserir_aresta("a", "b", peso=2)
+    g.inserir_aresta("b", "c", peso=3)
+    g.inserir_aresta("c", "d", peso=4)
+    g.remover_vertice("a")
+    g.remover_vertice("d")
+    g.remover_vertice("x")  # inexistente: nada muda
+    assert g.grafo == {"b": {"c": 3}, "c": {}}
+    assert g.dijkstra("b", "c") == (["b", "c"], 3)
+
+
+def test_vertice_de_grau_alto():
+    # a linha do hub passa de LIMITE_ARRAY e troca de representação
+    g = GrafoListaAdj()
+    n = 5000
+    for k in range(n):
+        g.inserir_aresta("hub", k, nao_direcionado=True)
+    g.inserir_aresta("hub", 3)  # repetida: nada muda
+    assert g.vizinhos("hub") == list(range(n))
+    assert g.existe_aresta("hub", n - 1) and g.existe_aresta(n - 1, "hub")
+    for k in range(0, n, 2):
+        g.remover_aresta("hub", k, nao_direcionado=True)
+    g.remover_vertice(1)
+    assert g.vizinhos("hub") == list(range(3, n, 2))
+    assert g.grau_vertices()["hub"] == {"entrada": n // 2 - 1, "saida": n // 2 - 1, "total": n - 2}
+    assert g.congelar().vizinhos("hub") == list(range(3, n, 2))
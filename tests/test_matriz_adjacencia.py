@@ -0,0 +1,61 @@
+import random
+from collections import deque
+
+from grafos import Grafo, GrafoBits, GrafoNumpy
+
+MOTORES = (Grafo, GrafoNumpy, GrafoBits)
+
+
+def _aleatorio(classe, n, m, direcionado, semente):
+    rng = random.Random(semente)
+    g = classe(direcionado)
+    for k in range(n):
+        g.inserir_vertice(f"v{k}")
+    for _ in range(m):
+        g.inserir_aresta(f"v{rng.randrange(n)}", f"v{rng.randrange(n)}")
+    return g
+
+
+def _distancias(g, inicio):
+    # BFS de referência, só com 'vizinhos'
+    distancias = {inicio: 0}
+    fila = deque([inicio])
+    while fila:
+        u = fila.popleft()
+        for v in g.vizinhos(u):
+            if v not in distancias:
+                distancias[v] = distancias[u] + 1
+                fila.append(v)
+    return distancias
+
+
+def test_menor_caminho_bidirecional_igual_a_bfs():
+    for classe in MOTORES:
+        for semente, direcionado in enumerate((True, False, True, False)):
+            g = _aleatorio(classe, 40, 60, direcionado, semente)
+            for inicio in ("v0", "v7", "v21"):
+                distancias = _distancias(g, inicio)
+                for destino in g.vertices:
+                    caminho = g.menorCaminho(inicio, destino, bidirecional=True)
+                    if destino not in distancias:
+                        assert caminho is None
+                        continue
+                    assert caminho[0] == inicio and caminho[-1] == destino
+                    assert len(caminho) - 1 == distancias[destino]
+                    assert all(g.existe_aresta(u, v) for u, v in zip(caminho, caminho[1:]))
+
+
+def test_bfs_direcional_igual_a_bfs():
+    # grafos densos o bastante para a busca passar para baixo para cima
+    for classe in MOTORES:
+        for semente, direcionado in enumerate((True, False)):
+            g = _aleatorio(classe, 150, 1500, direcionado, semente)
+            for grafo in (g, g.congelar()):
+                distancias, pais = grafo.bfs_direcional("v0", com_pais=True)
+                assert distancias == _distancias(g, "v0")
+                assert distancias == grafo.bfs_multiplas_origens(["v0"])
+                assert pais["v0"] is None
+                for v, pai in pais.items():
+                    if v != "v0":
+                        assert g.existe_aresta(pai, v) and distancias[pai] == distancias[v] - 1
+    assert Grafo(True).bfs_direcional("x") == {}
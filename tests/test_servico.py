@@ -0,0 +1,58 @@
+import asyncio
+import json
+
+from grafos import Grafo, ServicoConsultas
+
+
+def test_socket_responde_pedidos_fora_do_formato():
+    async def conversar():
+        g = Grafo(False)
+        g.inserir_aresta("A", "B")
+        async with ServicoConsultas(g) as servico:
+            servidor = await servico.servir()
+            porta = servidor.sockets[0].getsockname()[1]
+            leitor, escritor = await asyncio.open_connection("127.0.0.1", porta)
+            for pedido in ('[1, 2]', '{"id": 1, "op": "vizinhos", "args": "A"}',
+                           '{"id": 2, "op": "vizinhos", "args": ["A"]}'):
+                escritor.write(pedido.encode() + b"\n")
+            await escritor.drain()
+            respostas = [json.loads(await leitor.readline()) for _ in range(3)]
+            escritor.close()
+            await escritor.wait_closed()
+            await asyncio.sleep(0.05)
+            servidor.close()
+            await servidor.wait_closed()
+        return sorted(respostas, key=lambda r: r["id"] or 0)
+
+    sem_id, args_invalido, valido = asyncio.run(conversar())
+    assert sem_id["id"] is None and "erro" in sem_id
+    assert args_invalido["id"] == 1 and "erro" in args_invalido
+    assert valido == {"id": 2, "resultado": ["B"]}
+
+
+def test_rotulo_invalido_falha_so_o_proprio_pedido():
+    async def conversar():
+        g = Grafo(False)
+        g.inserir_aresta("A", "B")
+        g.inserir_aresta("B", "C")
+        async with ServicoConsultas(g, janela=0.05) as servico:
+            servidor = await servico.servir()
+            porta = servidor.sockets[0].getsockname()[1]
+            leitor, escritor = await asyncio.open_connection("127.0.0.1", porta)
+            for pedido in ('{"id": 1, "op": "menorCaminho", "args": [["A"], "B"]}',
+                           '{"id": 2, "op": "menorCaminho", "args": ["A", "C"]}',
+                           '{"id": 3, "op": "vizinhos", "args": ["B"]}'):
+                escritor.write(pedido.encode() + b"\n")
+            await escritor.drain()
+            respostas = [json.loads(await leitor.readline()) for _ in range(3)]
+            escritor.close()
+            await escritor.wait_closed()
+            await asyncio.sleep(0.05)
+            servidor.close()
+            await servidor.wait_closed()
+        return sorted(respostas, key=lambda r: r["id"])
+
+    invalido, caminho, vizinhos = asyncio.run(conversar())
+    assert invalido["id"] == 1 and invalido["erro"].startswith("TypeError")
+    assert caminho == {"id": 2, "resultado": ["A", "B", "C"]}
+    assert vizinhos == {"id": 3, "resultado": ["A", "C"]}